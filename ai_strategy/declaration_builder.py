@@ -17,6 +17,12 @@ import random
 from core.constants import BAG_SIZE_LIMIT
 from core.mechanics.goods import ALL_CONTRABAND, ALL_LEGAL
 
+# The fallback builders pick from fixed pools; resolve them once at import
+_LEGAL_IDS = tuple(g.id for g in ALL_LEGAL)
+_LEGAL_BY_VALUE = tuple(sorted(ALL_LEGAL, key=lambda g: g.value))
+_CONTRABAND_BY_VALUE = tuple(sorted(ALL_CONTRABAND, key=lambda g: g.value))
+_LEGAL_IDS_BY_VALUE = tuple(g.id for g in _LEGAL_BY_VALUE)
+
 
 def _find_most_common_good(goods: list, counts: dict) -> tuple[str, int]:
     """
@@ -70,11 +76,11 @@ def build_honest_declaration(available_goods: dict = None) -> dict:
             count = min(available_count, BAG_SIZE_LIMIT)
         else:
             # No legal goods in hand, fall back to any legal
-            declared = random.choice([g.id for g in ALL_LEGAL])
+            declared = random.choice(_LEGAL_IDS)
             count = min(random.randint(2, 4), BAG_SIZE_LIMIT)
     else:
         # No hand constraint - choose any legal goods
-        declared = random.choice([g.id for g in ALL_LEGAL])
+        declared = random.choice(_LEGAL_IDS)
         count = min(random.randint(2, 4), BAG_SIZE_LIMIT)
 
     return {
@@ -167,10 +173,10 @@ def build_legal_lie_declaration(
                 }
 
     # Fallback: If no available_goods provided, use old random logic
-    legal_by_value = sorted(ALL_LEGAL, key=lambda g: g.value)
+    legal_by_value = _LEGAL_BY_VALUE
 
     # Declare low-to-mid value good
-    declared = random.choice([g.id for g in legal_by_value[: len(legal_by_value) // 2]])
+    declared = random.choice(_LEGAL_IDS_BY_VALUE[: len(legal_by_value) // 2])
     count = min(random.randint(2, 4), BAG_SIZE_LIMIT)
 
     # Carry higher-value legal goods
@@ -243,11 +249,11 @@ def build_mixed_declaration(available_goods: dict = None) -> dict:
                 }
 
     # Fallback: If no available_goods provided, use old random logic
-    legal_by_value = sorted(ALL_LEGAL, key=lambda g: g.value)
-    contraband_by_value = sorted(ALL_CONTRABAND, key=lambda g: g.value)
+    legal_by_value = _LEGAL_BY_VALUE
+    contraband_by_value = _CONTRABAND_BY_VALUE
 
     # Declare legal good
-    declared = random.choice([g.id for g in legal_by_value])
+    declared = random.choice(_LEGAL_IDS_BY_VALUE)
     count = min(random.randint(3, 4), BAG_SIZE_LIMIT)
 
     # Carry mostly legal + 1 low-value contraband
@@ -277,11 +283,10 @@ def build_contraband_low_declaration(available_goods: dict = None) -> dict:
     - Declare: "2x Cheese"
     - Carry: "2x Weapons (contraband)"
     """
-    legal_by_value = sorted(ALL_LEGAL, key=lambda g: g.value)
-    contraband_by_value = sorted(ALL_CONTRABAND, key=lambda g: g.value)
+    contraband_by_value = _CONTRABAND_BY_VALUE
 
     # Declare legal good
-    declared = random.choice([g.id for g in legal_by_value])
+    declared = random.choice(_LEGAL_IDS_BY_VALUE)
     count = min(random.randint(2, 3), BAG_SIZE_LIMIT)
 
     # Carry mid-value contraband
@@ -310,8 +315,8 @@ def build_contraband_high_declaration(available_goods: dict = None) -> dict:
     - Declare: "5x Cheese"
     - Carry: "5x Silk (high-value contraband)"
     """
-    legal_by_value = sorted(ALL_LEGAL, key=lambda g: g.value)
-    contraband_by_value = sorted(ALL_CONTRABAND, key=lambda g: g.value)
+    legal_by_value = _LEGAL_BY_VALUE
+    contraband_by_value = _CONTRABAND_BY_VALUE
 
     # Declare low-value legal good (to keep bribe expectations lower)
     declared_good = random.choice(legal_by_value[: len(legal_by_value) // 2])
@@ -3,6 +3,10 @@ Decision Handling - Handles player decision prompts and input
 Extracted from game_manager.py for better testability and organization
 """
 
+# Accepted answers for prompt_inspection (input is stripped and lowercased)
+_INSPECT_ANSWERS = frozenset({"i", "inspect"})
+_PASS_ANSWERS = frozenset({"p", "pass"})
+
 
 def prompt_inspection(
     decision_prompt: str = "Inspect the bag or let them pass? [i/p]: ",
@@ -17,9 +21,9 @@ def prompt_inspection(
     """
     while True:
         choice = input(decision_prompt).strip().lower()
-        if choice in {"i", "inspect"}:
+        if choice in _INSPECT_ANSWERS:
             return True
-        if choice in {"p", "pass"}:
+        if choice in _PASS_ANSWERS:
             return False
         print("Please answer with 'i' to inspect or 'p' to pass.")
 
@@ -62,31 +62,31 @@ def display_inspection_results(merchant, declaration, actual_goods, result):
     show_inspection_header(merchant.name, declaration.count, declaration.good_id)
     show_bag_contents(actual_goods)
 
+    # Every branch sells whatever goods passed; total their value once
+    goods_passed = result["goods_passed"]
+    goods_value = sum(g.value for g in goods_passed)
+
     if not result["was_honest"] and not result["caught_lie"]:
         # Bluff succeeded
-        goods_value = sum(g.value for g in result["goods_passed"])
         merchant.gold += goods_value
         show_bluff_succeeded(merchant.name, goods_value, merchant.gold)
     elif result["was_honest"]:
         # Honest merchant
-        goods_value = sum(g.value for g in result["goods_passed"])
         merchant.gold += goods_value
         show_honest_verdict(
-            len(result["goods_passed"]), goods_value, merchant.name, merchant.gold
+            len(goods_passed), goods_value, merchant.name, merchant.gold
         )
     else:
         # Lying merchant caught
         show_lying_verdict(
-            result["goods_passed"],
+            goods_passed,
             result["goods_confiscated"],
             result["penalty_paid"],
             merchant.name,
             merchant.gold,
         )
-        # Add sold goods value if any passed
-        if result["goods_passed"]:
-            goods_value = sum(g.value for g in result["goods_passed"])
-            merchant.gold += goods_value
+        # Add sold goods value (zero if nothing passed)
+        merchant.gold += goods_value
 
     show_inspection_footer()
 
@@ -9,7 +9,7 @@ from core.players.merchants import Merchant
 from core.players.sheriff import Sheriff
 
 
-@dataclass
+@dataclass(slots=True)
 class Declaration:
     """What the merchant declares (one good type, count)."""
 
@@ -17,7 +17,7 @@ class Declaration:
     count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundState:
     """State for one round: one merchant, declaration, bribe, inspection result."""
 
@@ -66,10 +66,21 @@ def resolve_inspection(
             - sheriff_opens: Whether the bag was opened
             - sheriff_caught_lie: Whether a lie was detected
     """
+    # One pass over the bag: does every good match the declaration, and how
+    # much contraband would slip through if the sheriff doesn't open it
+    declared_id = declaration.good_id
+    all_match = True
+    contraband_count = 0
+    contraband_value = 0
+    for g in actual_goods:
+        if g.id != declared_id:
+            all_match = False
+        if g.is_contraband():
+            contraband_count += 1
+            contraband_value += g.value
+
     # Simple rule: sheriff rolls perception vs merchant bluff when declaration might be false
-    declared_ok = declaration.count == len(actual_goods) and all(
-        g.id == declaration.good_id for g in actual_goods
-    )
+    declared_ok = all_match and declaration.count == len(actual_goods)
     if declared_ok:
         return (False, False)
 
@@ -81,9 +92,8 @@ def resolve_inspection(
     # slipped past the inspector. Record a summary (count + total value)
     # on the provided RoundState if one was passed.
     if not declared_ok and not sheriff_opens and round_state is not None:
-        contraband_items = [g for g in actual_goods if g.is_contraband()]
-        round_state.contraband_passed_count = len(contraband_items)
-        round_state.contraband_passed_value = sum(g.value for g in contraband_items)
+        round_state.contraband_passed_count = contraband_count
+        round_state.contraband_passed_value = contraband_value
         # Let the merchant record their own aggregated summary for inspector queries
         try:
             merchant.record_round_result(round_state)
@@ -42,5 +42,7 @@ def build_bag_and_declaration(merchant: Merchant, history: list = None):
 
 def choose_tell(merchant: Merchant, is_honest: bool) -> str:
     """Pick a random tell line depending on whether the merchant is honest this round."""
+    if isinstance(merchant, Merchant):
+        return merchant.pick_tell(is_honest)
     pool = merchant.tells_honest if is_honest else merchant.tells_lying
     return random.choice(pool) if pool else ""
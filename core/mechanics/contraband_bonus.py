@@ -43,10 +43,12 @@ def calculate_contraband_bonus(goods: list[Good]) -> dict:
     # Calculate legal goods value (no bonuses)
     legal_value = sum(g.value for g in legal_goods)
 
-    # Count contraband by type
+    # Count contraband by type, keeping one good per id for its base value
     contraband_counts = {}
+    contraband_by_id = {}
     for good in contraband_goods:
         contraband_counts[good.id] = contraband_counts.get(good.id, 0) + 1
+        contraband_by_id.setdefault(good.id, good)
 
     # Calculate contraband value with bonuses
     contraband_base_value = sum(g.value for g in contraband_goods)
@@ -55,7 +57,7 @@ def calculate_contraband_bonus(goods: list[Good]) -> dict:
 
     for contraband_id, count in contraband_counts.items():
         # Get the good to find its base value
-        good = next(g for g in contraband_goods if g.id == contraband_id)
+        good = contraband_by_id[contraband_id]
         base_value = good.value * count
 
         # Apply multiplier based on count
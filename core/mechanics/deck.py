@@ -17,6 +17,7 @@ Total: 205 cards
 """
 
 import random
+from itertools import accumulate
 
 from core.constants import HAND_SIZE_LIMIT
 from core.mechanics.goods import GOOD_BY_ID, Good
@@ -36,8 +37,14 @@ CARD_WEIGHTS = {
 # Total cards for probability calculation
 TOTAL_CARDS = sum(CARD_WEIGHTS.values())  # 205
 
+# Deck goods and cumulative weights, built once for weighted draws
+_DECK_GOODS = [GOOD_BY_ID[good_id] for good_id in CARD_WEIGHTS]
+_DECK_CUM_WEIGHTS = list(accumulate(CARD_WEIGHTS.values()))
 
-def draw_hand(hand_size: int = HAND_SIZE_LIMIT) -> list[Good]:
+
+def draw_hand(
+    hand_size: int = HAND_SIZE_LIMIT, rng: random.Random = None
+) -> list[Good]:
     """
     Draw a hand of cards from the infinite deck.
 
@@ -47,21 +54,15 @@ def draw_hand(hand_size: int = HAND_SIZE_LIMIT) -> list[Good]:
 
     Args:
         hand_size: Number of cards to draw (default 7)
+        rng: Random generator to draw with (default: the global random module)
 
     Returns:
         List of Good objects representing the drawn cards
     """
-    # Create weighted list of good IDs
-    good_ids = list(CARD_WEIGHTS.keys())
-    weights = list(CARD_WEIGHTS.values())
-
-    # Draw cards with weighted probabilities
-    drawn_ids = random.choices(good_ids, weights=weights, k=hand_size)
-
-    # Convert IDs to Good objects
-    hand = [GOOD_BY_ID[good_id] for good_id in drawn_ids]
-
-    return hand
+    # Draw Good objects directly with the precomputed cumulative weights
+    return (rng or random).choices(
+        _DECK_GOODS, cum_weights=_DECK_CUM_WEIGHTS, k=hand_size
+    )
 
 
 def redraw_cards(
@@ -70,6 +71,7 @@ def redraw_cards(
     prefer_contraband: bool = False,
     prefer_legal: bool = False,
     prefer_high_value: bool = False,
+    rng: random.Random = None,
 ) -> list[Good]:
     """
     Redraw a specified number of cards from the current hand.
@@ -83,6 +85,7 @@ def redraw_cards(
         prefer_contraband: If True, keep contraband and discard legal goods
         prefer_legal: If True, keep legal goods and discard contraband
         prefer_high_value: If True, keep high-value cards and discard low-value ones
+        rng: Random generator to draw with (default: the global random module)
 
     Returns:
         New hand with unwanted cards discarded and replaced with new draws
@@ -107,13 +110,13 @@ def redraw_cards(
         sorted_hand = sorted(current_hand, key=lambda g: -g.value)
     else:
         # Random selection (no preference)
-        sorted_hand = random.sample(current_hand, len(current_hand))
+        sorted_hand = (rng or random).sample(current_hand, len(current_hand))
 
     # Keep the top cards based on preference, discard the rest
     kept_cards = sorted_hand[:num_to_keep]
 
     # Draw new cards to replace the discarded ones
-    new_cards = draw_hand(hand_size=num_to_redraw)
+    new_cards = draw_hand(hand_size=num_to_redraw, rng=rng)
 
     # Combine kept cards with newly drawn cards
     new_hand = kept_cards + new_cards
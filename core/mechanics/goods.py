@@ -21,7 +21,7 @@ class GoodKind(str, Enum):
     CONTRABAND = "contraband"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Good:
     """A single good type (e.g. apple, silk)."""
 
@@ -54,6 +54,7 @@ ALL_CONTRABAND: tuple[Good, ...] = (SILK, PEPPER, MEAD, CROSSBOW)
 ALL_GOODS: tuple[Good, ...] = ALL_LEGAL + ALL_CONTRABAND
 
 GOOD_BY_ID: dict[str, Good] = {g.id: g for g in ALL_GOODS}
+CONTRABAND_IDS: frozenset[str] = frozenset(g.id for g in ALL_CONTRABAND)
 
 
 def good_by_id(id: str) -> Optional[Good]:
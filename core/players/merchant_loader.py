@@ -5,6 +5,7 @@ Handles loading merchant data from JSON files
 
 import json
 import random
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,19 @@ def characters_dir() -> Path:
     return root / "characters"
 
 
+@cache
+def _read_merchant_file(path: Path) -> dict:
+    """Parse one merchant JSON file, once per process.
+
+    Merchant objects are still built fresh on every load_merchants() call,
+    so repeated games and simulations only skip the disk read and decode.
+    The returned dict is shared and must not be modified; copy any mutable
+    values (such as the tell lists) before handing them to a Merchant.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_merchants(limit: Optional[int] = None) -> list:
     """
     Load merchants from characters/data/*.json, randomly ordered.
@@ -52,8 +66,7 @@ def load_merchants(limit: Optional[int] = None) -> list:
     merchants: list[Merchant] = []
     for path in jsons:
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_merchant_file(path)
 
             # Validate required fields
             if "name" not in data:
@@ -69,8 +82,8 @@ def load_merchants(limit: Optional[int] = None) -> list:
                 id=data.get("id", path.stem),
                 name=data.get("name", path.stem),
                 intro=data.get("intro", ""),
-                tells_honest=data.get("tells_honest", []),
-                tells_lying=data.get("tells_lying", []),
+                tells_honest=list(data.get("tells_honest", [])),
+                tells_lying=list(data.get("tells_lying", [])),
                 bluff_skill=int(data.get("bluff_skill", 5)),
                 portrait_file=data.get("portrait_file"),
                 appearance=data.get("appearance", ""),
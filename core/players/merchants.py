@@ -1,7 +1,7 @@
 """Merchants: loaded from characters/data/ with personality, lore, tells, bluff skill."""
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from core.constants import (
@@ -12,6 +12,9 @@ from core.constants import (
 )
 from core.systems.game_master_state import MerchantTier
 
+# Tell lines are drawn this many at a time and handed out one per encounter
+_TELL_BATCH = 32
+
 
 @dataclass
 class Merchant:
@@ -37,6 +40,21 @@ class Merchant:
     past_legal_sold_value: int = 0
     # Gold tracking
     gold: int = 50  # Starting gold per Sheriff of Nottingham rules
+    # Prefetched tell picks per honesty, keyed with the pool they came from
+    _tell_picks: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def pick_tell(self, is_honest: bool) -> str:
+        """Pick a random tell line for this round ("" if there are none)."""
+        pool = self.tells_honest if is_honest else self.tells_lying
+        if not pool:
+            return ""
+        source, picks = self._tell_picks.get(is_honest, (None, None))
+        if source is not pool or not picks:
+            picks = random.choices(pool, k=_TELL_BATCH)
+            self._tell_picks[is_honest] = (pool, picks)
+        return picks.pop()
 
     def roll_bluff(self) -> int:
         """Roll for bluff (e.g. d10 + bluff_skill)."""
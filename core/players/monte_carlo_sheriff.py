@@ -5,14 +5,160 @@ This sheriff simulates deck draws to calculate the probability that a declaratio
 then uses expected value calculations to decide whether to inspect or accept bribes.
 """
 
-from collections import defaultdict
-from dataclasses import dataclass
+import logging
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
+from core.constants import HAND_SIZE_LIMIT
 from core.mechanics.deck import draw_hand, redraw_cards
-from core.mechanics.goods import GOOD_BY_ID, Good
+from core.mechanics.goods import GOOD_BY_ID, Good, GoodKind
 from core.players.sheriff import Sheriff
 
+logger = logging.getLogger(__name__)
+
+
+# Assume smugglers carry high-value contraband
+CONTRABAND_VALUE_MULTIPLIER = 1.8  # Contraband typically worth more
+
+
+def _declared_values(declared_good: str, declared_count: int) -> tuple[float, float]:
+    """Return (declared_value, expected_contraband_value) for a declaration."""
+    good = GOOD_BY_ID.get(declared_good, GOOD_BY_ID["apple"])
+    declared_value = good.value * declared_count
+    return declared_value, declared_value * CONTRABAND_VALUE_MULTIPLIER
+
+
+# Precomputed values for every good and count a bag can hold
+_DECLARED_VALUE_TABLE: dict[tuple[str, int], tuple[float, float]] = {
+    (good_id, count): _declared_values(good_id, count)
+    for good_id in GOOD_BY_ID
+    for count in range(HAND_SIZE_LIMIT + 1)
+}
+
+
+def _extract_likely_declaration(hand: list[Good]) -> Optional[tuple[str, int]]:
+    """
+    Extract the most likely declaration from a hand.
+    Merchants typically declare the most common good type.
+    """
+    if not hand:
+        return None
+
+    # Count each good type and take the most common one
+    good_counts = Counter(good.id for good in hand)
+    return good_counts.most_common(1)[0]
+
+
+def _simulate_draws(strategy: str, n: int, rng: random.Random) -> list[tuple[str, int]]:
+    """
+    Simulate n deck draws using the specified strategy.
+
+    Args:
+        strategy: 'honest' (redraw for legal) or 'smuggle' (redraw for contraband)
+        n: Number of simulations to run
+        rng: Random generator used for every draw and redraw
+
+    Returns:
+        List of (good_id, count) tuples representing likely declarations
+    """
+    # Preallocate the output and fill it by index
+    declarations = [None] * n
+    filled = 0
+
+    for _ in range(n):
+        # Draw initial hand (6 cards)
+        hand = draw_hand(hand_size=6, rng=rng)
+
+        # Count contraband from the precomputed kind field
+        contraband_count = [g.kind for g in hand].count(GoodKind.CONTRABAND)
+
+        # Apply redraw strategy
+        if strategy == "honest":
+            # Redraw contraband for legal goods
+            if contraband_count > 0 and contraband_count <= 4:
+                # Redraw contraband cards for legal goods
+                hand = redraw_cards(hand, contraband_count, prefer_legal=True, rng=rng)
+
+        elif strategy == "smuggle":
+            # Redraw legal goods for contraband
+            legal_count = len(hand) - contraband_count
+            if legal_count > 0 and legal_count <= 4:
+                # Redraw legal cards for contraband
+                hand = redraw_cards(hand, legal_count, prefer_contraband=True, rng=rng)
+
+        # Determine most likely declaration from this hand
+        declaration = _extract_likely_declaration(hand)
+        if declaration:
+            declarations[filled] = declaration
+            filled += 1
+
+    # Drop unused slots left by hands with no declaration
+    del declarations[filled:]
+    return declarations
+
+
+def _build_probability_table(
+    declarations: list[tuple[str, int]],
+) -> dict[tuple[str, int], float]:
+    """
+    Build probability table from simulation results.
+
+    Returns:
+        Dict mapping (good_id, count) -> probability
+    """
+    if not declarations:
+        return {}
+
+    # Count occurrences in a single C-level pass
+    counts = Counter(declarations)
+
+    # Convert to probabilities
+    total = len(declarations)
+    return {decl: count / total for decl, count in counts.items()}
+
+
+@lru_cache(maxsize=32)
+def _learn_distributions(
+    simulation_count: int, rng_seed: int
+) -> tuple[tuple[tuple[tuple[str, int], float], ...], ...]:
+    """
+    Learn the honest and smuggler declaration distributions.
+
+    Identical inputs always learn identical distributions, so results are
+    cached and returned as immutable (declaration, probability) pairs; callers
+    build their own dicts from them. The key does not cover the deck itself:
+    call _learn_distributions.cache_clear() after changing CARD_WEIGHTS or
+    patching draw_hand/redraw_cards.
+
+    Args:
+        simulation_count: Number of hands simulated per strategy
+        rng_seed: Seed for the simulation's random generator
+
+    Returns:
+        tuple: (honest pairs, smuggler pairs)
+    """
+    logger.info(
+        "[Monte Carlo Sheriff] Running %d simulations to learn deck probabilities...",
+        simulation_count,
+    )
+    rng = random.Random(rng_seed)
+
+    # Simulate honest merchant draws, then smuggler draws
+    honest = _build_probability_table(_simulate_draws("honest", simulation_count, rng))
+    smuggler = _build_probability_table(
+        _simulate_draws("smuggle", simulation_count, rng)
+    )
+
+    logger.info(
+        "[Monte Carlo Sheriff] Learned probabilities for %d declaration types",
+        len(honest),
+    )
+    return tuple(honest.items()), tuple(smuggler.items())
+
 
 @dataclass
 class MonteCarloSheriff(Sheriff):
@@ -29,8 +175,10 @@ class MonteCarloSheriff(Sheriff):
 
     # Simulation parameters
     simulation_count: int = 100
+    rng_seed: int = 0  # Seed for the simulation's own random generator
 
-    # Probability distributions (built on initialization)
+    # Probability distributions (built on initialization). Replace them rather
+    # than mutating them in place: derived tables are rebuilt only on replacement
     honest_distribution: dict[tuple[str, int], float] = None
     smuggler_distribution: dict[tuple[str, int], float] = None
 
@@ -42,6 +190,18 @@ class MonteCarloSheriff(Sheriff):
         1.2  # Multiplier for bribe value (1.2 = bribes worth 20% more)
     )
 
+    # log P(decl | honest) - log P(decl | smuggle), derived from the distributions
+    _log_likelihood_ratio: dict[tuple[str, int], float] = field(
+        default=None, init=False, repr=False
+    )
+    _likelihood_source: tuple = field(default=None, init=False, repr=False)
+
+    # Per merchant: (history list counted, last entry counted, honest, total).
+    # Counts are reused only while the caller keeps appending to the same list.
+    _honesty_cache: dict[str, tuple[list, dict, int, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def __post_init__(self):
         """Initialize probability distributions after dataclass initialization."""
         if self.honest_distribution is None:
@@ -56,139 +216,121 @@ class MonteCarloSheriff(Sheriff):
         """
         Run Monte Carlo simulations to build probability distributions.
         This is the core of the sheriff's intelligence.
-        """
-        print(
-            f"[Monte Carlo Sheriff] Running {self.simulation_count} simulations to learn deck probabilities..."
-        )
-
-        # Simulate honest merchant draws
-        honest_declarations = self._simulate_draws(
-            strategy="honest", n=self.simulation_count
-        )
-        self.honest_distribution = self._build_probability_table(honest_declarations)
-
-        # Simulate smuggler draws
-        smuggler_declarations = self._simulate_draws(
-            strategy="smuggle", n=self.simulation_count
-        )
-        self.smuggler_distribution = self._build_probability_table(
-            smuggler_declarations
-        )
 
-        print(
-            f"[Monte Carlo Sheriff] Learned probabilities for {len(self.honest_distribution)} declaration types"
-        )
+        Sheriffs with the same (simulation_count, rng_seed) share one cached
+        simulation run; see _learn_distributions.
+        """
+        honest, smuggler = _learn_distributions(self.simulation_count, self.rng_seed)
+        self.honest_distribution = dict(honest)
+        self.smuggler_distribution = dict(smuggler)
 
-    def _simulate_draws(self, strategy: str, n: int) -> list[tuple[str, int]]:
+    def should_inspect(
+        self,
+        merchant_name: str,
+        declaration: dict,
+        bribe_offered: int,
+        merchant_history: list[dict] = None,
+    ) -> bool:
         """
-        Simulate n deck draws using the specified strategy.
+        Decide whether to inspect based on expected value calculation.
 
         Args:
-            strategy: 'honest' (redraw for legal) or 'smuggle' (redraw for contraband)
-            n: Number of simulations to run
+            merchant_name: Name of the merchant
+            declaration: Declaration dict with 'good_id' and 'count'
+            bribe_offered: Bribe amount (0 if no bribe)
+            merchant_history: List of past interactions with this merchant
 
         Returns:
-            List of (good_id, count) tuples representing likely declarations
-        """
-        declarations = []
-
-        for _ in range(n):
-            # Draw initial hand (6 cards)
-            hand = draw_hand(hand_size=6)
-
-            # Apply redraw strategy
-            if strategy == "honest":
-                # Redraw contraband for legal goods
-                contraband_count = sum(1 for g in hand if g.is_contraband)
-                if contraband_count > 0 and contraband_count <= 4:
-                    # Redraw contraband cards for legal goods
-                    hand = redraw_cards(hand, contraband_count, prefer_legal=True)
-
-            elif strategy == "smuggle":
-                # Redraw legal goods for contraband
-                legal_count = sum(1 for g in hand if not g.is_contraband)
-                if legal_count > 0 and legal_count <= 4:
-                    # Redraw legal cards for contraband
-                    hand = redraw_cards(hand, legal_count, prefer_contraband=True)
-
-            # Determine most likely declaration from this hand
-            declaration = self._extract_likely_declaration(hand)
-            if declaration:
-                declarations.append(declaration)
-
-        return declarations
-
-    def _extract_likely_declaration(
-        self, hand: list[Good]
-    ) -> Optional[tuple[str, int]]:
+            True if should inspect, False if should let pass (or accept bribe)
         """
-        Extract the most likely declaration from a hand.
-        Merchants typically declare the most common good type.
+        p_honest_prior = self._get_merchant_honesty_rate(
+            merchant_history, merchant_name
+        )
+        return self._decide(
+            declaration.get("good_id", "apple"),
+            declaration.get("count", 4),
+            bribe_offered,
+            p_honest_prior,
+        )[0]
+
+    def batch_should_inspect(
+        self,
+        merchant_names: list[str],
+        declarations: list[dict],
+        bribes: list[int],
+        merchant_histories: list[list[dict]] = None,
+    ) -> list[bool]:
         """
-        if not hand:
-            return None
-
-        # Count each good type
-        good_counts = defaultdict(int)
-        for good in hand:
-            good_counts[good.id] += 1
+        Decide whether to inspect each merchant in a queued batch.
 
-        # Find most common good
-        if not good_counts:
-            return None
+        Decisions are independent, so each one is made exactly as in
+        should_inspect.
 
-        most_common_good = max(good_counts.items(), key=lambda x: x[1])
-        return most_common_good
-
-    def _build_probability_table(
-        self, declarations: list[tuple[str, int]]
-    ) -> dict[tuple[str, int], float]:
-        """
-        Build probability table from simulation results.
+        Args:
+            merchant_names: Names of the merchants, one per decision
+            declarations: Declaration dicts with 'good_id' and 'count'
+            bribes: Bribe amounts (0 if no bribe)
+            merchant_histories: Past interactions per merchant (optional)
 
         Returns:
-            Dict mapping (good_id, count) -> probability
+            List of inspect decisions, in the same order as the inputs
         """
-        if not declarations:
-            return {}
+        if merchant_histories is None:
+            merchant_histories = [None] * len(merchant_names)
 
-        # Count occurrences
-        counts = defaultdict(int)
-        for decl in declarations:
-            counts[decl] += 1
+        return [
+            self.should_inspect(name, declaration, bribe, history)
+            for name, declaration, bribe, history in zip(
+                merchant_names, declarations, bribes, merchant_histories, strict=True
+            )
+        ]
 
-        # Convert to probabilities
-        total = len(declarations)
-        probabilities = {decl: count / total for decl, count in counts.items()}
+    def _refresh_likelihood_ratio(self) -> None:
+        """
+        Rebuild the log-likelihood table if its inputs changed.
 
-        return probabilities
+        The table is only valid for the distributions it was built from. They
+        are compared by identity, so assign new dicts to honest_distribution or
+        smuggler_distribution instead of editing them in place.
+        """
+        cached = self._likelihood_source
+        if (
+            cached is not None
+            and cached[0] is self.honest_distribution
+            and cached[1] is self.smuggler_distribution
+        ):
+            return
+
+        self._log_likelihood_ratio = {
+            key: math.log(max(self.honest_distribution.get(key, 0.01), 1e-6))
+            - math.log(max(self.smuggler_distribution.get(key, 0.01), 1e-6))
+            for key in self.honest_distribution.keys()
+            | self.smuggler_distribution.keys()
+        }
+        self._likelihood_source = (
+            self.honest_distribution,
+            self.smuggler_distribution,
+        )
 
-    def should_inspect(
+    def _decide(
         self,
-        merchant_name: str,
-        declaration: dict,
+        declared_good: str,
+        declared_count: int,
         bribe_offered: int,
-        merchant_history: list[dict] = None,
-    ) -> bool:
+        p_honest_prior: float,
+    ) -> tuple[bool, float, float, float]:
         """
-        Decide whether to inspect based on expected value calculation.
+        Run the full Bayes + expected value calculation for one decision.
 
         Args:
-            merchant_name: Name of the merchant
-            declaration: Declaration dict with 'good_id' and 'count'
-            bribe_offered: Bribe amount (0 if no bribe)
-            merchant_history: List of past interactions with this merchant
+            p_honest_prior: The merchant's honesty rate from their history
 
         Returns:
-            True if should inspect, False if should let pass (or accept bribe)
+            Tuple of (inspect, p_honest, ev_inspect, ev_accept)
         """
-        # Extract declaration info
-        declared_good = declaration.get("good_id", "apple")
-        declared_count = declaration.get("count", 4)
-
         # Calculate probability that declaration is honest
-        p_honest = self._calculate_honesty_probability(
-            declared_good, declared_count, merchant_history
+        p_honest = self._posterior_honesty(
+            declared_good, declared_count, p_honest_prior
         )
 
         # Calculate expected values
@@ -202,71 +344,138 @@ class MonteCarloSheriff(Sheriff):
         # If very confident it's a lie (p_honest < risk_tolerance), inspect
         # Otherwise, compare expected values
         if p_honest < self.risk_tolerance:
-            return ev_inspect > ev_accept
+            inspect = ev_inspect > ev_accept
         else:
             # When uncertain, weight bribes more heavily
-            return ev_inspect > ev_accept * 1.5
+            inspect = ev_inspect > ev_accept * 1.5
+
+        return inspect, p_honest, ev_inspect, ev_accept
 
     def _calculate_honesty_probability(
         self,
         declared_good: str,
         declared_count: int,
         merchant_history: list[dict] = None,
+        merchant_name: str = None,
     ) -> float:
         """
         Calculate P(honest | declaration, history) using Bayes' theorem.
 
         P(honest | declaration) = P(declaration | honest) * P(honest) / P(declaration)
+
+        Evaluated in log space as sigmoid(log-likelihood ratio + prior log-odds),
+        which needs no zero-denominator check.
         """
-        decl_key = (declared_good, declared_count)
+        # Calculate prior P(honest) from merchant history
+        p_honest_prior = self._get_merchant_honesty_rate(
+            merchant_history, merchant_name
+        )
+        return self._posterior_honesty(declared_good, declared_count, p_honest_prior)
 
-        # Get probabilities from simulation
-        p_decl_given_honest = self.honest_distribution.get(decl_key, 0.01)
-        p_decl_given_smuggle = self.smuggler_distribution.get(decl_key, 0.01)
+    def _posterior_honesty(
+        self, declared_good: str, declared_count: int, p_honest_prior: float
+    ) -> float:
+        """Combine a known prior with the declaration's likelihood ratio."""
+        if p_honest_prior == 0.0 or p_honest_prior == 1.0:
+            return p_honest_prior  # History is conclusive either way
 
-        # Calculate prior P(honest) from merchant history
-        p_honest_prior = self._get_merchant_honesty_rate(merchant_history)
+        # Get log-likelihood ratio from simulation (0 when neither saw it)
+        self._refresh_likelihood_ratio()
+        log_ratio = self._log_likelihood_ratio.get((declared_good, declared_count), 0.0)
 
         # Bayes' theorem
-        numerator = p_decl_given_honest * p_honest_prior
-        denominator = p_decl_given_honest * p_honest_prior + p_decl_given_smuggle * (
-            1 - p_honest_prior
-        )
+        logit = log_ratio + math.log(p_honest_prior) - math.log1p(-p_honest_prior)
+        return 1.0 / (1.0 + math.exp(-logit))
+
+    def record_encounter(self, merchant_name: str, entry: dict) -> None:
+        """
+        Fold one new encounter into the merchant's running honesty counts.
 
-        if denominator == 0:
-            return 0.5  # No information, assume 50/50
+        Call this after appending entry to the merchant's history list, so the
+        next lookup with that list needs no scan. If entry was not appended to
+        the tracked list, the next lookup notices and rescans.
 
-        return numerator / denominator
+        Args:
+            merchant_name: Name of the merchant
+            entry: History entry with 'opened' and 'caught' keys
+        """
+        source, _, honest_count, total_count = self._honesty_cache.get(
+            merchant_name, (None, None, 0, 0)
+        )
+        self._honesty_cache[merchant_name] = (
+            source,
+            entry,
+            honest_count + self._was_honest(entry),
+            total_count + 1,
+        )
 
-    def _get_merchant_honesty_rate(self, history: list[dict] = None) -> float:
+    def _get_merchant_honesty_rate(
+        self, history: list[dict] = None, merchant_name: str = None
+    ) -> float:
         """
         Calculate merchant's historical honesty rate.
 
+        When a merchant name is given and history is the same list as last time
+        with entries only appended, just the new entries are scanned. Any other
+        history (a new list, or one that shrank or changed) is rescanned.
+
         Returns:
             Float between 0 and 1 (default 0.5 if no history)
         """
         if not history:
             return 0.5  # Default prior
 
-        # Count honest vs dishonest encounters
-        honest_count = 0
-        total_count = 0
+        if merchant_name is None:
+            honest_count, total_count = self._count_honest(history)
+        else:
+            honest_count, total_count = self._cached_honesty(history, merchant_name)
+
+        return honest_count / total_count
+
+    def _cached_honesty(
+        self, history: list[dict], merchant_name: str
+    ) -> tuple[int, int]:
+        """Return (honest, total) for a non-empty history, reusing cached counts."""
+        source, last_entry, honest_count, total_count = self._honesty_cache.get(
+            merchant_name, (None, None, 0, 0)
+        )
+        appended_only = (
+            source is history
+            and 0 < total_count <= len(history)
+            and history[total_count - 1] is last_entry
+        )
+        if not appended_only:
+            honest_count, total_count = self._count_honest(history)
+        elif total_count < len(history):
+            # History only grew, so fold in just the new entries
+            new_honest, new_total = self._count_honest(history[total_count:])
+            honest_count += new_honest
+            total_count += new_total
+
+        self._honesty_cache[merchant_name] = (
+            history,
+            history[-1],
+            honest_count,
+            total_count,
+        )
+        return honest_count, total_count
 
+    def _count_honest(self, history: list[dict]) -> tuple[int, int]:
+        """Count (honest, total) encounters in a history list."""
+        honest_count = 0
         for entry in history:
-            if entry.get("opened"):
-                total_count += 1
-                # If opened and not caught, was honest
-                if not entry.get("caught", False):
-                    honest_count += 1
-            else:
-                # If not opened, assume was honest (conservative estimate)
-                total_count += 1
-                honest_count += 1
-
-        if total_count == 0:
-            return 0.5
+            honest_count += self._was_honest(entry)
+        return honest_count, len(history)
 
-        return honest_count / total_count
+    @staticmethod
+    def _was_honest(entry: dict) -> bool:
+        """
+        Whether an encounter counts as honest.
+
+        Opened and caught means dishonest; opened and not caught means honest.
+        Unopened bags are assumed honest (conservative estimate).
+        """
+        return not (entry.get("opened") and entry.get("caught", False))
 
     def _calculate_inspection_ev(
         self, declared_good: str, declared_count: int, p_honest: float
@@ -276,16 +485,13 @@ class MonteCarloSheriff(Sheriff):
 
         EV(inspect) = P(lie) * value_if_caught - P(honest) * penalty_if_wrong
         """
-        # Get declared value
-        good = GOOD_BY_ID.get(declared_good, GOOD_BY_ID["apple"])
-        declared_value = good.value * declared_count
+        values = _DECLARED_VALUE_TABLE.get((declared_good, declared_count))
+        if values is None:
+            values = _declared_values(declared_good, declared_count)
 
-        # If they're lying, estimate contraband value
-        # Assume smugglers carry high-value contraband
-        avg_contraband_value = declared_value * 1.8  # Contraband typically worth more
-
-        # Penalty for inspecting honest merchant
-        penalty = declared_value
+        # Penalty for inspecting honest merchant is the declared value;
+        # if they're lying, expect higher-value contraband
+        penalty, avg_contraband_value = values
 
         # Expected value calculation
         p_lie = 1 - p_honest
@@ -329,24 +535,15 @@ class MonteCarloSheriff(Sheriff):
         """
         declared_good = declaration.get("good_id", "apple")
         declared_count = declaration.get("count", 4)
-
-        p_honest = self._calculate_honesty_probability(
-            declared_good, declared_count, merchant_history
+        p_honest_prior = self._get_merchant_honesty_rate(
+            merchant_history, merchant_name
         )
 
-        ev_inspect = self._calculate_inspection_ev(
-            declared_good, declared_count, p_honest
+        inspect, p_honest, ev_inspect, ev_accept = self._decide(
+            declared_good, declared_count, bribe_offered, p_honest_prior
         )
 
-        ev_accept = bribe_offered * self.bribe_weight
-
-        decision = (
-            "INSPECT"
-            if self.should_inspect(
-                merchant_name, declaration, bribe_offered, merchant_history
-            )
-            else "LET PASS"
-        )
+        decision = "INSPECT" if inspect else "LET PASS"
 
         reasoning = (
             f"[Monte Carlo Sheriff Analysis]\n"
@@ -362,7 +559,10 @@ class MonteCarloSheriff(Sheriff):
 
 
 def create_monte_carlo_sheriff(
-    simulation_count: int = 100, risk_tolerance: float = 0.5, bribe_weight: float = 1.2
+    simulation_count: int = 100,
+    risk_tolerance: float = 0.5,
+    bribe_weight: float = 1.2,
+    rng_seed: int = 0,
 ) -> MonteCarloSheriff:
     """
     Factory function to create a Monte Carlo Sheriff with custom parameters.
@@ -371,6 +571,7 @@ def create_monte_carlo_sheriff(
         simulation_count: Number of simulations to run (default 100)
         risk_tolerance: How cautious the sheriff is (0=aggressive, 1=cautious)
         bribe_weight: How much to value bribes (1.0=face value, 1.2=20% bonus)
+        rng_seed: Seed for the simulation's random generator (default 0)
 
     Returns:
         Configured MonteCarloSheriff instance
@@ -379,4 +580,5 @@ def create_monte_carlo_sheriff(
         simulation_count=simulation_count,
         risk_tolerance=risk_tolerance,
         bribe_weight=bribe_weight,
+        rng_seed=rng_seed,
     )
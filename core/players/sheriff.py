@@ -10,7 +10,7 @@ from core.constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Sheriff:
     """The Sheriff inspecting merchants. Can level up experience."""
 
@@ -6,6 +6,21 @@ Used by both base merchants and sophisticated strategists like Silas.
 """
 
 
+def _is_lie(entry: dict) -> bool:
+    """
+    Check whether an encounter's bag contents differ from its declaration.
+
+    Uses list.count so the per-item comparison runs in C instead of a
+    Python-level generator over the bag.
+    """
+    decl = entry.get("declaration", {})
+    actual_ids = entry.get("actual_ids", [])
+    bag_size = len(actual_ids)
+    return bag_size != decl.get("count") or (
+        actual_ids.count(decl.get("good_id")) != bag_size
+    )
+
+
 def calculate_catch_rate(history: list[dict]) -> float:
     """
     Calculate simple catch rate: % of liars caught by sheriff.
@@ -30,15 +45,7 @@ def calculate_catch_rate(history: list[dict]) -> float:
     lies_caught = 0
 
     for h in history:
-        decl = h.get("declaration", {})
-        actual_ids = h.get("actual_ids", [])
-
-        # Check if this was a lie
-        is_lie = len(actual_ids) != decl.get("count") or any(
-            aid != decl.get("good_id") for aid in actual_ids
-        )
-
-        if is_lie:
+        if _is_lie(h):
             total_lies += 1
             if h.get("caught_lie"):
                 lies_caught += 1
@@ -89,23 +96,13 @@ def analyze_sheriff_detailed(history: list[dict]) -> dict:
         }
 
     for item in history:
-        decl = item.get("declaration", {})
-        actual = item.get("actual_ids", [])
-        was_opened = item.get("opened", False)
-        caught = item.get("caught_lie", False)
-
-        # Determine if merchant was honest
-        declared_ok = decl.get("count") == len(actual) and all(
-            a == decl.get("good_id") for a in actual
-        )
-
-        if declared_ok:
+        if not _is_lie(item):
             # Honest merchant
-            if was_opened:
+            if item.get("opened", False):
                 truths_inspected += 1
         else:
             # Lying merchant
-            if caught:
+            if item.get("caught_lie", False):
                 lies_caught += 1
             else:
                 lies_successful += 1
@@ -8,25 +8,173 @@ An information broker who analyzes sheriff behavior patterns and adapts his stra
 """
 
 import random
-
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from itertools import compress
+from typing import ClassVar
+
+from ai_strategy import declaration_builder
+from core.mechanics import deck
 from core.mechanics.goods import GOOD_BY_ID
 from core.players.merchants import Merchant
+from core.systems import game_master_state
+from core.systems.game_master_state import HistoryView
+
+# deck, declaration_builder and game_master_state are used through their
+# modules so helpers patched on those modules are picked up at call time
+
+
+def _history_columns(history) -> tuple[list, list, list, list]:
+    """
+    Split a history into (opened, caught, bribe_offered, bribe_accepted) columns.
+
+    HistoryView already stores events column-wise, so its columns are sliced
+    directly; plain lists of event dicts are read field by field.
+    """
+    if isinstance(history, HistoryView):
+        return (
+            history.opened,
+            history.caught,
+            history.bribe_offered,
+            history.bribe_accepted,
+        )
+    return (
+        [h.get("opened", False) for h in history],
+        [h.get("caught", False) or h.get("caught_lie", False) for h in history],
+        [h.get("bribe_offered", 0) for h in history],
+        [h.get("bribe_accepted", False) for h in history],
+    )
+
+
+def _history_rows(history) -> list[tuple]:
+    """
+    Per-event (opened, caught, bribe_offered, bribe_ratio, bribe_accepted) rows.
+
+    Recent HistoryView windows come straight from GameMasterState's ring
+    buffer of recent events; plain lists of event dicts are read per entry.
+    """
+    if isinstance(history, HistoryView):
+        return history.rows()
+    return [
+        (
+            h.get("opened", False),
+            h.get("caught", False) or h.get("caught_lie", False),
+            h.get("bribe_offered", 0),
+            _entry_bribe_ratio(h),
+            h.get("bribe_accepted", False),
+        )
+        for h in history
+    ]
+
+
+def _entry_bribe_ratio(history_entry: dict) -> float:
+    """Calculate bribe amount as ratio of declared value for one event dict."""
+    bribe_amt = history_entry.get("bribe_offered", 0)
+    if bribe_amt == 0:
+        return 0.0
+
+    # Recorded events carry their declared value already
+    declared_value = history_entry.get("declared_value")
+    if declared_value is not None:
+        return bribe_amt / declared_value if declared_value else 0.0
 
+    # Get declared value
+    declaration = history_entry.get("declaration", {})
+    if isinstance(declaration, dict):
+        declared_count = declaration.get("count", 0)
+        declared_good_id = declaration.get("good_id", "apple")
+    else:
+        declared_count = history_entry.get("declared_count", 0)
+        declared_good_id = history_entry.get("declared_good", "apple")
 
+    declared_good = GOOD_BY_ID.get(declared_good_id, GOOD_BY_ID["apple"])
+    declared_value = declared_good.value * declared_count
+
+    if declared_value == 0:
+        return 0.0
+
+    return bribe_amt / declared_value
+
+
+def _greedy_acceptance(ratios, accepted) -> tuple[int, int, int, int]:
+    """One pass over bribe columns: (high, high_accepted, low, low_accepted)."""
+    high = high_accepted = low = low_accepted = 0
+    for ratio, was_accepted in zip(ratios, accepted, strict=True):
+        if ratio >= 0.45:
+            high += 1
+            high_accepted += was_accepted
+        else:
+            low += 1
+            low_accepted += was_accepted
+    return high, high_accepted, low, low_accepted
+
+
+def _recent_accepted_ratio_mean(rows: list, last_n: int = 5) -> float:
+    """Mean of the last last_n accepted bribe ratios, scanning rows from the end."""
+    found = []
+    for _, _, _, ratio, was_accepted in reversed(rows):
+        if was_accepted and ratio > 0:
+            found.append(ratio)
+            if len(found) == last_n:
+                break
+    return sum(reversed(found)) / len(found) if found else 0.0
+
+
+def _same_history(cached, history) -> bool:
+    """Whether a cached history covers the same events as history."""
+    if cached is history:
+        return True
+    return isinstance(history, HistoryView) and history.same_events(cached)
+
+
+@dataclass
 class SilasVoss(Merchant):
     """Information Broker who analyzes sheriff patterns and adapts strategy accordingly."""
 
+    # Last (history, length, result) seen by the history scans below. Several
+    # decisions in one turn query the same history, so repeat scans are skipped.
+    _sheriff_type_cache: ClassVar[tuple] = (None, None, None)
+    _bribe_ratio_cache: ClassVar[tuple] = (None, None, None)
+
+    # Sheriff type keyed by (accepts most bribes, inspects or rejects many):
+    # CORRUPT accepts >80%; STRICT inspects >40% of bribes or accepts <30%
+    # (covers Trigger Happy, who inspects ALL bribes). None means moderate
+    # acceptance (30-80%), which is checked for a greedy pattern.
+    _BRIBE_RESPONSE_TYPES: ClassVar[dict] = {
+        (True, False): "corrupt",
+        (True, True): "corrupt",
+        (False, True): "strict",
+        (False, False): None,
+    }
+
+    # Chance of playing honest against a classified sheriff: always smuggle
+    # past CORRUPT, mostly smuggle past GREEDY, Legal Good Trick vs STRICT
+    _HONEST_CHANCE_BY_TYPE: ClassVar[dict] = {
+        "corrupt": 0.0,
+        "greedy": 0.15,
+        "strict": 1.0,
+    }
+    # (catch rate above, honest chance) for an unknown sheriff, highest first
+    _HONEST_CHANCE_BY_CATCH_RATE: ClassVar[tuple] = ((0.40, 0.85), (0.30, 0.70))
+
+    # Per-merchant RNG so concurrent simulations don't share random's global state
+    _rng: random.Random = field(
+        default_factory=random.Random, init=False, repr=False, compare=False
+    )
+
     def choose_declaration(self, history: list = None) -> dict:
         """Choose what to declare based on profit analysis and sheriff patterns."""
-        from core.mechanics.deck import redraw_cards, should_redraw_for_silas
-        from core.systems.game_master_state import get_game_master_state
-
         # Get collective merchant history
-        game_state = get_game_master_state()
-        full_history = game_state.get_history_for_tier(None)
+        game_state = game_master_state.get_game_master_state()
+        full_history = game_state.get_history_for_tier(None, as_dicts=False)
+
+        # Classify the sheriff once for this turn; the bribe decisions that
+        # follow hit the per-history cache for the same events
+        sheriff_type = self._detect_sheriff_type(full_history)
 
         # Decide strategy: honest or smuggle
-        play_honest = self._should_play_honest(full_history)
+        play_honest = self._should_play_honest(full_history, sheriff_type)
 
         # Get goods and make declaration
         hand = self.hand if hasattr(self, "hand") else []
@@ -39,86 +187,114 @@ class SilasVoss(Merchant):
                 "lie": False,
             }
 
-        # STRATEGIC CARD REDRAWING using Silas's sophisticated analysis
-        # Prepare sheriff analysis data
-        recent = full_history[-10:] if len(full_history) >= 10 else full_history
-        inspections = sum(1 for h in recent if h.get("opened", False))
-        inspection_rate = inspections / len(recent) if recent else 0.5
-
-        caught = sum(1 for h in recent if h.get("caught", False))
-        catch_rate = caught / len(recent) if recent else 0.5
-
-        sheriff_analysis = {
-            "inspection_rate": inspection_rate,
-            "catch_rate": catch_rate,
-            "history": full_history,
-        }
-
-        # Adaptive redraw strategy based on sheriff type
-        sheriff_type = self._detect_sheriff_type(full_history)
-
-        if sheriff_type in ["corrupt", "greedy"]:
-            # CORRUPT/GREEDY: Maximize contraband aggressively
-            # Redraw ALL legal cards to get maximum contraband
-            legal_cards = [g for g in hand if g.is_legal()]
-            if len(legal_cards) > 0:
-                hand = redraw_cards(
-                    hand,
-                    len(legal_cards),
-                    prefer_contraband=True,
-                    prefer_high_value=True,
-                )
-                self.hand = hand
-        else:
-            # Normal redraw strategy
-            num_to_redraw = should_redraw_for_silas(hand, sheriff_analysis)
-            if num_to_redraw > 0:
-                if play_honest:
-                    hand = redraw_cards(
-                        hand, num_to_redraw, prefer_legal=True, prefer_high_value=True
-                    )
-                else:
-                    hand = redraw_cards(hand, num_to_redraw, prefer_contraband=True)
-                self.hand = hand
+        # STRATEGIC CARD REDRAWING, specialized by sheriff type
+        redraw = self._REDRAW_BY_TYPE.get(sheriff_type, SilasVoss._redraw_by_analysis)
+        hand = redraw(self, hand, full_history, play_honest)
 
         # Use existing declaration builders instead of custom logic
-        from collections import Counter
-
-        from ai_strategy.declaration_builder import (
-            build_contraband_high_declaration,
-            build_honest_declaration,
-        )
-
         if play_honest:
             # Honest play: use honest declaration builder
-            return build_honest_declaration(available_goods={"hand": hand})
+            return declaration_builder.build_honest_declaration(
+                available_goods={"hand": hand}
+            )
         else:
             # Smuggling: check if we have contraband
-            contraband = [g for g in hand if not g.is_legal()]
-            if contraband:
+            if any(not g.is_legal() for g in hand):
                 # Use contraband high declaration builder for optimal selection
                 # It already prioritizes high-value contraband and set bonuses
                 available_goods = Counter(g.id for g in hand)
-                return build_contraband_high_declaration(
+                return declaration_builder.build_contraband_high_declaration(
                     available_goods=available_goods
                 )
             else:
                 # No contraband, play honest
-                return build_honest_declaration(available_goods={"hand": hand})
+                return declaration_builder.build_honest_declaration(
+                    available_goods={"hand": hand}
+                )
+
+    def _redraw_for_smuggling(self, hand: list, history, play_honest: bool) -> list:
+        """CORRUPT/GREEDY: Redraw ALL legal cards to get maximum contraband."""
+        legal_count = sum(1 for g in hand if g.is_legal())
+        if legal_count > 0:
+            hand = deck.redraw_cards(
+                hand,
+                legal_count,
+                prefer_contraband=True,
+                prefer_high_value=True,
+            )
+            self.hand = hand
+        return hand
+
+    def _redraw_by_analysis(self, hand: list, history, play_honest: bool) -> list:
+        """Normal redraw strategy using Silas's sophisticated analysis."""
+        # Prepare sheriff analysis data
+        recent = history[-10:] if len(history) >= 10 else history
+        opened, caught_lies, _, _ = _history_columns(recent)
+        inspections = sum(opened)
+        inspection_rate = inspections / len(recent) if recent else 0.5
+
+        caught = sum(caught_lies)
+        catch_rate = caught / len(recent) if recent else 0.5
+
+        sheriff_analysis = {
+            "inspection_rate": inspection_rate,
+            "catch_rate": catch_rate,
+            "history": history,
+        }
+
+        num_to_redraw = deck.should_redraw_for_silas(hand, sheriff_analysis)
+        if num_to_redraw > 0:
+            if play_honest:
+                hand = deck.redraw_cards(
+                    hand, num_to_redraw, prefer_legal=True, prefer_high_value=True
+                )
+            else:
+                hand = deck.redraw_cards(hand, num_to_redraw, prefer_contraband=True)
+            self.hand = hand
+        return hand
+
+    # Redraw strategy per sheriff type; anything else uses _redraw_by_analysis
+    _REDRAW_BY_TYPE: ClassVar[dict] = {
+        "corrupt": _redraw_for_smuggling,
+        "greedy": _redraw_for_smuggling,
+    }
 
     def _detect_sheriff_type(self, history: list) -> str:
         """
         Detect sheriff behavior pattern.
         Returns: 'corrupt', 'greedy', 'strict', or 'unknown'
         """
+        cached_history, cached_len, cached_type = self._sheriff_type_cache
+        if _same_history(cached_history, history) and cached_len == len(history):
+            return cached_type
+
+        sheriff_type = self._classify_sheriff_type(history)
+        self._sheriff_type_cache = (history, len(history), sheriff_type)
+        return sheriff_type
+
+    def _classify_sheriff_type(self, history: list) -> str:
+        """Scan history and classify the sheriff (uncached _detect_sheriff_type)."""
         if len(history) < 5:
             return "unknown"
 
         recent = history[-10:] if len(history) >= 10 else history
+        rows = _history_rows(recent)
+
+        # Single pass: overall inspections plus acceptance and inspection
+        # counts among bribed rounds
+        inspected_rounds = 0
+        bribed = 0
+        accepted = 0
+        inspected = 0
+        for was_opened, _, amount, _, was_accepted in rows:
+            inspected_rounds += was_opened
+            if amount > 0:
+                bribed += 1
+                accepted += was_accepted
+                inspected += was_opened
 
         # Check overall inspection rate (including all merchants)
         total_rounds = len(recent)
-        inspected_rounds = sum(1 for h in recent if h.get("opened", False))
         overall_inspection_rate = (
             inspected_rounds / total_rounds if total_rounds > 0 else 0
         )
@@ -128,45 +304,31 @@ class SilasVoss(Merchant):
         if overall_inspection_rate > 0.50:
             return "strict"
 
-        bribed = [h for h in recent if h.get("bribe_offered", 0) > 0]
-
-        if len(bribed) < 3:
-            # Not enough bribe data in recent history, look at longer history
-            longer_history = history[-20:] if len(history) >= 20 else history
-            bribed = [h for h in longer_history if h.get("bribe_offered", 0) > 0]
-
-            # Still not enough bribe data, but check if sheriff is suspicious
+        if bribed < 3:
+            # Not enough bribe data, but check if sheriff is suspicious
             if overall_inspection_rate > 0.40:
                 return "strict"
             return "unknown"
 
-        # Calculate acceptance rate
-        accepted = sum(1 for h in bribed if h.get("bribe_accepted", False))
-        acceptance_rate = accepted / len(bribed)
-
-        # CORRUPT: Accepts most bribes (>80%)
-        if acceptance_rate > 0.80:
-            return "corrupt"
-
-        # STRICT: High inspection rate among bribes (>40%) OR low acceptance (<30%)
-        # Catches sheriffs who inspect bribes frequently or reject most bribes
-        # This includes Trigger Happy (inspects ALL bribes) and strict inspectors
-        inspected = sum(1 for h in bribed if h.get("opened", False))
-        inspection_rate = inspected / len(bribed)
-
-        # If inspection rate is very high (>60%) or acceptance is very low (<20%), definitely strict
-        if inspection_rate > 0.60 or acceptance_rate < 0.20:
-            return "strict"
-
-        # If inspection rate is high (>40%) or acceptance is low (<30%), likely strict
-        if inspection_rate > 0.40 or acceptance_rate < 0.30:
-            return "strict"
+        # Classify by how the sheriff treats bribes
+        acceptance_rate = accepted / bribed
+        inspection_rate = inspected / bribed
+        sheriff_type = self._BRIBE_RESPONSE_TYPES[
+            (
+                acceptance_rate > 0.80,
+                inspection_rate > 0.40 or acceptance_rate < 0.30,
+            )
+        ]
+        if sheriff_type is not None:
+            return sheriff_type
 
         # GREEDY: Moderate acceptance (30-80%), prefers high bribes
-        if 0.30 <= acceptance_rate <= 0.80:
-            greedy_result = self._detect_greedy_pattern(bribed)
-            if greedy_result:
-                return "greedy"
+        _, _, bribes, ratios, accepted_flags = zip(*rows, strict=True)
+        was_bribed = [amount > 0 for amount in bribes]
+        if self._ratios_show_greedy(
+            compress(ratios, was_bribed), compress(accepted_flags, was_bribed)
+        ):
+            return "greedy"
 
         return "unknown"
 
@@ -181,17 +343,20 @@ class SilasVoss(Merchant):
         Returns:
             True if greedy pattern detected, False otherwise
         """
+        return self._ratios_show_greedy(
+            [self._get_bribe_ratio(h) for h in bribed],
+            [h.get("bribe_accepted", False) for h in bribed],
+        )
+
+    @staticmethod
+    def _ratios_show_greedy(ratios: Iterable, accepted: Iterable) -> bool:
+        """Greedy check on parallel bribe-ratio and accepted columns."""
         # Check if high bribes get accepted more than low bribes
-        high_bribes = [h for h in bribed if self._get_bribe_ratio(h) >= 0.45]
-        low_bribes = [h for h in bribed if self._get_bribe_ratio(h) < 0.45]
+        high, high_accepted, low, low_accepted = _greedy_acceptance(ratios, accepted)
 
-        if len(high_bribes) >= 2 and len(low_bribes) >= 2:
-            high_acceptance = sum(
-                1 for h in high_bribes if h.get("bribe_accepted", False)
-            ) / len(high_bribes)
-            low_acceptance = sum(
-                1 for h in low_bribes if h.get("bribe_accepted", False)
-            ) / len(low_bribes)
+        if high >= 2 and low >= 2:
+            high_acceptance = high_accepted / high
+            low_acceptance = low_accepted / low
 
             if high_acceptance > low_acceptance + 0.10:
                 return True
@@ -200,62 +365,37 @@ class SilasVoss(Merchant):
 
     def _get_bribe_ratio(self, history_entry: dict) -> float:
         """Calculate bribe amount as ratio of declared value."""
-        bribe_amt = history_entry.get("bribe_offered", 0)
-        if bribe_amt == 0:
-            return 0.0
-
-        # Get declared value
-        declaration = history_entry.get("declaration", {})
-        if isinstance(declaration, dict):
-            declared_count = declaration.get("count", 0)
-            declared_good_id = declaration.get("good_id", "apple")
-        else:
-            declared_count = history_entry.get("declared_count", 0)
-            declared_good_id = history_entry.get("declared_good", "apple")
-
-        declared_good = GOOD_BY_ID.get(declared_good_id, GOOD_BY_ID["apple"])
-        declared_value = declared_good.value * declared_count
-
-        if declared_value == 0:
-            return 0.0
+        return _entry_bribe_ratio(history_entry)
 
-        return bribe_amt / declared_value
+    def _should_play_honest(self, history: list, sheriff_type: str = None) -> bool:
+        """Decide whether to play honest based on sheriff type.
 
-    def _should_play_honest(self, history: list) -> bool:
-        """Decide whether to play honest based on sheriff type."""
+        Callers that already classified the sheriff for this history can pass
+        sheriff_type to skip the lookup.
+        """
         if len(history) < 3:
-            return random.random() < 0.50
-
-        sheriff_type = self._detect_sheriff_type(history)
-
-        # CORRUPT: Always smuggle
-        if sheriff_type == "corrupt":
-            return False
-
-        # GREEDY: Smuggle most of the time
-        if sheriff_type == "greedy":
-            return random.random() < 0.15
-
-        # STRICT: Use Legal Good Trick (honest goods + bribe)
-        if sheriff_type == "strict":
-            return True
-
-        # UNKNOWN: Use catch rate analysis
-        recent = history[-10:] if len(history) >= 10 else history
-        if len(recent) >= 4:
-            caught_count = sum(
-                1
-                for h in recent
-                if h.get("caught", False) or h.get("caught_lie", False)
-            )
-            catch_rate = caught_count / len(recent)
-
-            if catch_rate > 0.40:
-                return random.random() < 0.85
-            elif catch_rate > 0.30:
-                return random.random() < 0.70
-
-        return False
+            return self._rng.random() < 0.50
+
+        if sheriff_type is None:
+            sheriff_type = self._detect_sheriff_type(history)
+
+        honest_chance = self._HONEST_CHANCE_BY_TYPE.get(sheriff_type)
+        if honest_chance is None:
+            # UNKNOWN: Use catch rate analysis
+            honest_chance = 0.0
+            recent = history[-10:] if len(history) >= 10 else history
+            if len(recent) >= 4:
+                _, caught, _, _ = _history_columns(recent)
+                catch_rate = sum(caught) / len(recent)
+                for floor, chance in self._HONEST_CHANCE_BY_CATCH_RATE:
+                    if catch_rate > floor:
+                        honest_chance = chance
+                        break
+
+        # Certain outcomes don't consume a random draw
+        if honest_chance <= 0.0 or honest_chance >= 1.0:
+            return honest_chance >= 1.0
+        return self._rng.random() < honest_chance
 
     def should_offer_proactive_bribe(
         self,
@@ -265,25 +405,23 @@ class SilasVoss(Merchant):
         declared_goods: list,
     ) -> bool:
         """Decide whether to offer a bribe based on sheriff type and goods."""
-        from core.systems.game_master_state import get_game_master_state
-
         has_contraband = any(not g.is_legal() for g in actual_goods)
         is_lying = len(actual_goods) != len(declared_goods) or any(
             a.id != d.id for a, d in zip(actual_goods, declared_goods)
         )
 
-        game_state = get_game_master_state()
-        history = game_state.get_history_for_tier(None)
+        game_state = game_master_state.get_game_master_state()
+        history = game_state.get_history_for_tier(None, as_dicts=False)
 
         # EARLY EXPLORATION: Offer bribes in first 10 rounds to gather data
-        if len(history) < 10 and random.random() < 0.40:
+        if len(history) < 10 and self._rng.random() < 0.40:
             return True
 
         sheriff_type = self._detect_sheriff_type(history)
 
         # CORRUPT: Bribe sometimes when smuggling (50%)
         if sheriff_type == "corrupt" and (has_contraband or is_lying):
-            return random.random() < 0.50
+            return self._rng.random() < 0.50
 
         # GREEDY: Always bribe when smuggling
         if sheriff_type == "greedy" and (has_contraband or is_lying):
@@ -310,8 +448,6 @@ class SilasVoss(Merchant):
         declared_goods: list = None,
     ) -> int:
         """Calculate bribe amount based on sheriff type and detected patterns."""
-        from core.systems.game_master_state import get_game_master_state
-
         has_contraband = any(not g.is_legal() for g in actual_goods)
 
         # Calculate declared value
@@ -320,54 +456,50 @@ class SilasVoss(Merchant):
         else:
             declared_value = sum(g.value for g in actual_goods)
 
-        game_state = get_game_master_state()
-        history = game_state.get_history_for_tier(None)
+        game_state = game_master_state.get_game_master_state()
+        history = game_state.get_history_for_tier(None, as_dicts=False)
         sheriff_type = self._detect_sheriff_type(history)
 
         if has_contraband or is_lying:
             # CORRUPT: Low bribes (15-25%)
             if sheriff_type == "corrupt":
-                return max(1, int(declared_value * random.uniform(0.15, 0.25)))
+                return max(1, int(declared_value * self._rng.uniform(0.15, 0.25)))
 
             # GREEDY: High bribes with learning
             if sheriff_type == "greedy":
                 avg_ratio = self._learn_successful_bribe_ratio(history)
                 if avg_ratio > 0:
-                    target_ratio = avg_ratio * random.uniform(0.97, 1.03)
+                    target_ratio = avg_ratio * self._rng.uniform(0.97, 1.03)
                     target_ratio = max(target_ratio, 0.50)
                     return max(1, int(declared_value * target_ratio))
                 else:
-                    return max(1, int(declared_value * random.uniform(0.55, 0.70)))
+                    return max(1, int(declared_value * self._rng.uniform(0.55, 0.70)))
 
             # UNKNOWN: Moderate bribes (30-60%)
-            return max(1, int(declared_value * random.uniform(0.30, 0.60)))
+            return max(1, int(declared_value * self._rng.uniform(0.30, 0.60)))
         else:
             # LEGAL GOOD TRICK: Honest goods + small bribe (20-35%)
             total_value = sum(g.value for g in actual_goods)
-            return max(1, int(total_value * random.uniform(0.20, 0.35)))
+            return max(1, int(total_value * self._rng.uniform(0.20, 0.35)))
 
     def _learn_successful_bribe_ratio(self, history: list) -> float:
         """Analyze history to learn what bribe ratios get accepted."""
+        cached_history, cached_len, cached_ratio = self._bribe_ratio_cache
+        if _same_history(cached_history, history) and cached_len == len(history):
+            return cached_ratio
+
+        ratio = self._average_successful_bribe_ratio(history)
+        self._bribe_ratio_cache = (history, len(history), ratio)
+        return ratio
+
+    def _average_successful_bribe_ratio(self, history: list) -> float:
+        """Average accepted bribe ratio (uncached _learn_successful_bribe_ratio)."""
         if len(history) < 3:
             return 0.0
 
         # Look at more history for better learning
         recent = history[-20:] if len(history) >= 20 else history
-        successful_ratios = []
-
-        for h in recent:
-            if h.get("bribe_accepted", False) and h.get("bribe_offered", 0) > 0:
-                ratio = self._get_bribe_ratio(h)
-                if ratio > 0:
-                    successful_ratios.append(ratio)
-
-        # Return average if we have at least 1 successful bribe
-        if len(successful_ratios) >= 1:
-            # Weight recent successes more heavily
-            if len(successful_ratios) > 5:
-                # Use last 5 successful bribes with more weight
-                recent_ratios = successful_ratios[-5:]
-                return sum(recent_ratios) / len(recent_ratios)
-            return sum(successful_ratios) / len(successful_ratios)
 
-        return 0.0
+        # Average the last 5 successful bribes (all of them if fewer), so
+        # recent successes are weighted more heavily
+        return _recent_accepted_ratio_mean(_history_rows(recent))
@@ -15,11 +15,24 @@ All merchants query this single source of truth, with tier-based access:
 Uses context variables for thread-safe, test-isolated state management.
 """
 
+from collections import deque
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from typing import Optional
 
+from core.mechanics.goods import GOOD_BY_ID
+
+# Number of recent events kept for windowed sheriff statistics
+RECENT_WINDOW_SIZE = 20
+
+
+def _declared_value(declared_good: str, declared_count: int) -> int:
+    """Value of a declaration (unknown goods count as apples)."""
+    good = GOOD_BY_ID.get(declared_good) or GOOD_BY_ID["apple"]
+    return good.value * declared_count
+
 
 class MerchantTier(Enum):
     """Difficulty tier for merchant AI sophistication."""
@@ -29,7 +42,7 @@ class MerchantTier(Enum):
     HARD = "hard"
 
 
-@dataclass
+@dataclass(slots=True)
 class InspectionEvent:
     """Record of a single merchant encounter."""
 
@@ -43,6 +56,7 @@ class InspectionEvent:
     bribe_accepted: bool  # Did sheriff accept bribe?
     proactive_bribe: bool  # Was bribe offered before threat?
     round_number: int  # Which round of the game
+    declared_value: int = 0  # Gold value of the declaration
 
 
 @dataclass
@@ -52,11 +66,39 @@ class GameMasterState:
 
     This is the single source of truth for all game history.
     Merchants query subsets based on their tier.
+
+    Events are stored column-wise (one list per InspectionEvent field) so
+    analyses that need a single field can sum or slice it directly.
     """
 
-    events: list[InspectionEvent] = field(default_factory=list)
+    merchant_names: list[str] = field(default_factory=list)
+    declared_goods: list[str] = field(default_factory=list)
+    declared_counts: list[int] = field(default_factory=list)
+    declared_values: list[int] = field(default_factory=list)
+    actual_goods: list[list[str]] = field(default_factory=list)
+    was_opened: list[bool] = field(default_factory=list)
+    caught_lie: list[bool] = field(default_factory=list)
+    bribe_offered: list[int] = field(default_factory=list)
+    bribe_ratios: list[float] = field(default_factory=list)
+    bribe_accepted: list[bool] = field(default_factory=list)
+    proactive_bribe: list[bool] = field(default_factory=list)
+    round_numbers: list[int] = field(default_factory=list)
     current_round: int = 0
 
+    # Running totals and a ring buffer of the most recent events, kept up to
+    # date by record_event so stats queries never rescan the full history.
+    # Each recent_events row is (opened, caught_lie, bribe_offered,
+    # bribe_ratio, bribe_accepted).
+    _total_inspections: int = field(default=0, init=False, repr=False)
+    _total_catches: int = field(default=0, init=False, repr=False)
+    _total_bribes_offered: int = field(default=0, init=False, repr=False)
+    _total_bribes_accepted: int = field(default=0, init=False, repr=False)
+    recent_events: deque = field(
+        default_factory=lambda: deque(maxlen=RECENT_WINDOW_SIZE),
+        init=False,
+        repr=False,
+    )
+
     def record_event(
         self,
         merchant_name: str,
@@ -70,62 +112,105 @@ class GameMasterState:
         proactive_bribe: bool = False,
     ) -> None:
         """Record a new inspection event."""
-        event = InspectionEvent(
-            merchant_name=merchant_name,
-            declared_good=declared_good,
-            declared_count=declared_count,
-            actual_goods=actual_goods,
-            was_opened=was_opened,
-            caught_lie=caught_lie,
-            bribe_offered=bribe_offered,
-            bribe_accepted=bribe_accepted,
-            proactive_bribe=proactive_bribe,
-            round_number=self.current_round,
+        self.merchant_names.append(merchant_name)
+        self.declared_goods.append(declared_good)
+        self.declared_counts.append(declared_count)
+        declared_value = _declared_value(declared_good, declared_count)
+        self.declared_values.append(declared_value)
+        self.actual_goods.append(actual_goods)
+        self.was_opened.append(was_opened)
+        self.caught_lie.append(caught_lie)
+        self.bribe_offered.append(bribe_offered)
+        self.bribe_ratios.append(
+            bribe_offered / declared_value if bribe_offered and declared_value else 0.0
         )
-        self.events.append(event)
+        self.bribe_accepted.append(bribe_accepted)
+        self.proactive_bribe.append(proactive_bribe)
+        self.round_numbers.append(self.current_round)
         self.current_round += 1
 
-    def get_history_for_tier(self, tier: MerchantTier) -> list[dict]:
+        self._total_inspections += was_opened
+        self._total_catches += caught_lie
+        self._total_bribes_offered += bribe_offered > 0
+        self._total_bribes_accepted += bribe_accepted
+        self.recent_events.append(
+            (
+                was_opened,
+                caught_lie,
+                bribe_offered,
+                self.bribe_ratios[-1],
+                bribe_accepted,
+            )
+        )
+
+    @property
+    def events(self) -> list[InspectionEvent]:
+        """All recorded events as InspectionEvent objects (oldest first)."""
+        return [self._event_at(i) for i in range(len(self.round_numbers))]
+
+    def _event_at(self, index: int) -> InspectionEvent:
+        """Assemble the InspectionEvent stored at a column index."""
+        return InspectionEvent(
+            merchant_name=self.merchant_names[index],
+            declared_good=self.declared_goods[index],
+            declared_count=self.declared_counts[index],
+            actual_goods=self.actual_goods[index],
+            was_opened=self.was_opened[index],
+            caught_lie=self.caught_lie[index],
+            bribe_offered=self.bribe_offered[index],
+            bribe_accepted=self.bribe_accepted[index],
+            proactive_bribe=self.proactive_bribe[index],
+            round_number=self.round_numbers[index],
+            declared_value=self.declared_values[index],
+        )
+
+    def get_history_for_tier(
+        self, tier: MerchantTier, as_dicts: bool = True
+    ) -> "list[dict] | HistoryView":
         """
         Get history slice appropriate for merchant tier.
 
         Args:
             tier: Merchant difficulty tier
+            as_dicts: If False, return a HistoryView over the columns instead
+                of building one dict per event
 
         Returns:
-            List of event dictionaries (most recent first)
+            List of event dictionaries (most recent first), or a HistoryView
         """
+        total = len(self.round_numbers)
         if tier == MerchantTier.EASY:
             # Last 1-2 events
-            slice_size = min(2, len(self.events))
+            slice_size = min(2, total)
         elif tier == MerchantTier.MEDIUM:
             # Last 3-4 events
-            slice_size = min(4, len(self.events))
+            slice_size = min(4, total)
         else:  # HARD
             # Full history
-            slice_size = len(self.events)
+            slice_size = total
 
-        # Get most recent events
-        recent_events = self.events[-slice_size:] if slice_size > 0 else []
+        if not as_dicts:
+            return HistoryView(self, total - slice_size, total)
 
-        # Convert to dict format for compatibility with existing code
-        return [self._event_to_dict(event) for event in recent_events]
+        # Convert the most recent events to dict format for compatibility
+        return [self._event_to_dict(i) for i in range(total - slice_size, total)]
 
-    def _event_to_dict(self, event: InspectionEvent) -> dict:
-        """Convert InspectionEvent to dictionary format."""
+    def _event_to_dict(self, index: int) -> dict:
+        """Convert the event at a column index to dictionary format."""
         return {
-            "merchant_name": event.merchant_name,
+            "merchant_name": self.merchant_names[index],
             "declaration": {
-                "good_id": event.declared_good,
-                "count": event.declared_count,
+                "good_id": self.declared_goods[index],
+                "count": self.declared_counts[index],
             },
-            "actual_ids": event.actual_goods,
-            "opened": event.was_opened,
-            "caught_lie": event.caught_lie,
-            "bribe_offered": event.bribe_offered,
-            "bribe_accepted": event.bribe_accepted,
-            "proactive_bribe": event.proactive_bribe,
-            "round_number": event.round_number,
+            "declared_value": self.declared_values[index],
+            "actual_ids": self.actual_goods[index],
+            "opened": self.was_opened[index],
+            "caught_lie": self.caught_lie[index],
+            "bribe_offered": self.bribe_offered[index],
+            "bribe_accepted": self.bribe_accepted[index],
+            "proactive_bribe": self.proactive_bribe[index],
+            "round_number": self.round_numbers[index],
         }
 
     def get_sheriff_stats(self) -> dict:
@@ -135,7 +220,7 @@ class GameMasterState:
         Returns:
             Dict with inspection_rate, catch_rate, bribe_acceptance_rate, etc.
         """
-        if not self.events:
+        if not self.round_numbers:
             return {
                 "inspection_rate": 0.5,
                 "catch_rate": 0.5,
@@ -143,11 +228,11 @@ class GameMasterState:
                 "total_encounters": 0,
             }
 
-        total = len(self.events)
-        inspections = sum(1 for e in self.events if e.was_opened)
-        catches = sum(1 for e in self.events if e.caught_lie)
-        bribes_offered = sum(1 for e in self.events if e.bribe_offered > 0)
-        bribes_accepted = sum(1 for e in self.events if e.bribe_accepted)
+        total = len(self.round_numbers)
+        inspections = self._total_inspections
+        catches = self._total_catches
+        bribes_offered = self._total_bribes_offered
+        bribes_accepted = self._total_bribes_accepted
 
         # Calculate rates
         inspection_rate = inspections / total if total > 0 else 0.5
@@ -167,6 +252,33 @@ class GameMasterState:
             "bribes_accepted": bribes_accepted,
         }
 
+    def get_window_stats(self, last_n: int = RECENT_WINDOW_SIZE) -> dict:
+        """
+        Count outcomes over the most recent events.
+
+        Args:
+            last_n: Window size (capped at RECENT_WINDOW_SIZE)
+
+        Returns:
+            Dict with events, inspections, catches, bribes_offered, bribes_accepted
+        """
+        window = self.recent_events
+        skip = max(0, len(window) - last_n)
+        inspections = catches = bribes_offered = bribes_accepted = 0
+        for opened, caught, bribe, _, accepted in islice(window, skip, None):
+            inspections += opened
+            catches += caught
+            bribes_offered += bribe > 0
+            bribes_accepted += accepted
+
+        return {
+            "events": len(window) - skip,
+            "inspections": inspections,
+            "catches": catches,
+            "bribes_offered": bribes_offered,
+            "bribes_accepted": bribes_accepted,
+        }
+
     def get_recent_inspection_pattern(self, last_n: int = 5) -> str:
         """
         Analyze recent inspection pattern.
@@ -174,11 +286,11 @@ class GameMasterState:
         Returns:
             String describing pattern: 'aggressive', 'moderate', 'lenient'
         """
-        if not self.events:
+        if not self.was_opened:
             return "moderate"
 
-        recent = self.events[-last_n:]
-        inspection_rate = sum(1 for e in recent if e.was_opened) / len(recent)
+        recent = self.was_opened[-last_n:]
+        inspection_rate = sum(recent) / len(recent)
 
         if inspection_rate > 0.7:
             return "aggressive"
@@ -188,6 +300,104 @@ class GameMasterState:
             return "moderate"
 
 
+class HistoryView:
+    """
+    Read-only window over a range of GameMasterState events.
+
+    Column properties return plain lists for the range, so analyses that only
+    need a few fields never build per-event dicts. Indexing and iteration
+    still yield event dicts, so a view can stand in for a history list.
+    """
+
+    __slots__ = ("_state", "_start", "_end")
+
+    def __init__(self, state: GameMasterState, start: int, end: int):
+        self._state = state
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return HistoryView(
+                self._state, self._start + start, self._start + max(start, stop)
+            )
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("history index out of range")
+        return self._state._event_to_dict(self._start + key)
+
+    def __iter__(self):
+        for index in range(self._start, self._end):
+            yield self._state._event_to_dict(index)
+
+    def rows(self) -> list[tuple]:
+        """
+        Per-event (opened, caught_lie, bribe_offered, bribe_ratio, bribe_accepted).
+
+        Views that end at the latest event and fit in the recent_events ring
+        buffer read it directly; older ranges zip the columns.
+        """
+        state = self._state
+        recent = state.recent_events
+        skip = len(recent) - len(self)
+        if self._end == len(state.round_numbers) and skip >= 0:
+            return list(islice(recent, skip, None))
+        return list(
+            zip(
+                self.opened,
+                self.caught,
+                self.bribe_offered,
+                self.bribe_ratio,
+                self.bribe_accepted,
+                strict=True,
+            )
+        )
+
+    def same_events(self, other) -> bool:
+        """Whether another view covers exactly the same events."""
+        return (
+            isinstance(other, HistoryView)
+            and other._state is self._state
+            and other._start == self._start
+            and other._end == self._end
+        )
+
+    @property
+    def opened(self) -> list[bool]:
+        return self._state.was_opened[self._start : self._end]
+
+    @property
+    def caught(self) -> list[bool]:
+        return self._state.caught_lie[self._start : self._end]
+
+    @property
+    def bribe_offered(self) -> list[int]:
+        return self._state.bribe_offered[self._start : self._end]
+
+    @property
+    def bribe_ratio(self) -> list[float]:
+        return self._state.bribe_ratios[self._start : self._end]
+
+    @property
+    def bribe_accepted(self) -> list[bool]:
+        return self._state.bribe_accepted[self._start : self._end]
+
+    @property
+    def declared_goods(self) -> list[str]:
+        return self._state.declared_goods[self._start : self._end]
+
+    @property
+    def declared_counts(self) -> list[int]:
+        return self._state.declared_counts[self._start : self._end]
+
+
 # Context variable for thread-safe, test-isolated state management
 _game_state_ctx: ContextVar[Optional[GameMasterState]] = ContextVar(
     "game_state", default=None
@@ -3,14 +3,152 @@ Game Logging System
 Handles error logging to file instead of displaying to users
 """
 
+import atexit
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Directory for game logs (core/logs), resolved once at import
+_LOGS_DIR = Path(__file__).resolve().parents[1] / "logs"
+
+
+class BufferedFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes in a large buffer.
+
+    The stream is flushed when an ERROR (or worse) is logged, when
+    flush_interval seconds have passed since the last flush, and on close.
+    A timer flushes lines left in the buffer once the log goes quiet.
+    Set max_bytes to roll the file over at that size (0 never rotates).
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode: str = "a",
+        encoding: str = None,
+        delay: bool = False,
+        buffer_size: int = 65536,
+        flush_interval: float = 2.0,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._force_flush = False
+        self._flush_timer = None
+        super().__init__(filename, mode, max_bytes, backup_count, encoding, delay)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._force_flush = record.levelno >= logging.ERROR
+        super().emit(record)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # noqa: N802
+        # The base class stats the path on every record before checking the
+        # size; our log paths are always regular files, so skip that
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        message = f"{self.format(record)}\n"
+        return self.stream.tell() + len(message) >= self.maxBytes
+
+    def flush(self) -> None:
+        # StreamHandler.emit calls flush() after every record; only hit the
+        # disk for errors or once the interval has elapsed
+        if self.stream is None:
+            return
+        elapsed = time.monotonic() - self._last_flush
+        if self._force_flush or elapsed >= self.flush_interval:
+            self._flush_now()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self._flush_now)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_now(self) -> None:
+        with self.lock:
+            self._flush_timer = None
+            self._last_flush = time.monotonic()
+            super().flush()
+
+    def close(self) -> None:
+        with self.lock:
+            timer = self._flush_timer
+            if timer is not None:
+                timer.cancel()
+            self._flush_timer = None
+            self._flush_now()
+            # The base close() flushes once more; make that a real flush too
+            # rather than arming a timer on a closing handler
+            self._force_flush = True
+            super().close()
+
+
+def attach_queued_handlers(
+    logger: logging.Logger, *handlers: logging.Handler
+) -> QueueListener:
+    """
+    Route a logger's records to handlers on a background thread.
+
+    The logger only gets a QueueHandler, so logging calls enqueue the record
+    instead of formatting and writing it under the handler lock. The
+    listener is stopped (flushing anything queued) at interpreter exit.
+
+    Args:
+        logger: Logger to attach the queue to
+        *handlers: Handlers that do the actual formatting and I/O
+
+    Returns:
+        QueueListener: The started listener (also set as queue_handler.listener)
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.listener = listener
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(_stop_listener, listener)
+    return listener
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Stop a listener, flushing queued records; safe to call twice."""
+    if listener._thread is not None:
+        listener.stop()
+
+
+def stop_queued_handlers(logger: logging.Logger) -> None:
+    """Stop and detach any queue listeners attached to a logger."""
+    for handler in list(logger.handlers):
+        listener = getattr(handler, "listener", None)
+        if isinstance(handler, QueueHandler) and listener is not None:
+            _stop_listener(listener)
+            for target in listener.handlers:
+                target.close()
+        logger.removeHandler(handler)
+
 
 def setup_logger(name: str = "sheriff_game") -> logging.Logger:
     """
-    Set up a logger that writes to both file and console (for development).
+    Set up a standalone logger with its own file handler.
+
+    The game itself logs through game_logger, whose output is handled by
+    setup_error_logging(); use this for tools that run without that setup.
 
     Args:
         name: Logger name
@@ -27,12 +165,11 @@ def setup_logger(name: str = "sheriff_game") -> logging.Logger:
     logger.setLevel(logging.DEBUG)
 
     # Create logs directory if it doesn't exist
-    log_dir = Path(__file__).parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
+    _LOGS_DIR.mkdir(exist_ok=True)
 
     # File handler - logs everything to file
-    log_file = log_dir / f"game_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    log_file = _LOGS_DIR / f"game_{datetime.now().strftime('%Y%m%d')}.log"
+    file_handler = BufferedFileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
 
     # Formatter
@@ -42,7 +179,7 @@ def setup_logger(name: str = "sheriff_game") -> logging.Logger:
     )
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+    attach_queued_handlers(logger, file_handler)
 
     # Only add console handler if not in pygame mode (check if DISPLAY is set or running in terminal)
     # This prevents logs from appearing in the pygame window
@@ -51,21 +188,29 @@ def setup_logger(name: str = "sheriff_game") -> logging.Logger:
     return logger
 
 
-# Global logger instance
-game_logger = setup_logger()
+# Global logger instance. It has no handlers of its own: records propagate to
+# the root logger, which setup_error_logging() configures once at startup.
+# Before that, logging's last-resort handler still reports warnings and errors.
+game_logger = logging.getLogger("sheriff_game")
 
 
-def log_error(message: str, exception: Exception = None):
+def log_error(message: str, exception: Exception = None, with_traceback: bool = True):
     """
     Log an error message with optional exception details.
 
     Args:
         message: Error message to log
         exception: Optional exception object
+        with_traceback: If False, log only the exception type and message
+            instead of formatting its traceback
     """
     if exception:
+        # Only build the exception summary if ERROR records are kept
+        if not game_logger.isEnabledFor(logging.ERROR):
+            return
         game_logger.error(
-            f"{message}: {type(exception).__name__}: {str(exception)}", exc_info=True
+            f"{message}: {type(exception).__name__}: {str(exception)}",
+            exc_info=with_traceback,
         )
     else:
         game_logger.error(message)
@@ -3,9 +3,10 @@ Sheriff Reputation Management
 Handles reputation and experience updates based on decisions
 """
 
-from core.mechanics.goods import Good
+from core.mechanics.goods import CONTRABAND_IDS, Good
 from core.players.sheriff import Sheriff
 from core.systems.game_stats import GameStats
+from ui.output import flush_output
 
 
 def update_sheriff_reputation(
@@ -46,7 +47,7 @@ def update_sheriff_reputation(
         # Merchant lied and got away with it
         # Check if they smuggled contraband or just lied about legal goods
         if actual_goods:
-            has_contraband = any(g.is_contraband() for g in actual_goods)
+            has_contraband = any(g.id in CONTRABAND_IDS for g in actual_goods)
             if has_contraband:
                 # Serious failure - let contraband through
                 sheriff.reputation = max(0, sheriff.reputation - 2)
@@ -66,3 +67,4 @@ def update_sheriff_reputation(
     print(
         f"[Sheriff] Reputation: {sheriff.reputation}/10  |  Experience: {sheriff.experience}"
     )
+    flush_output()
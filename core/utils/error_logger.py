@@ -4,12 +4,70 @@ Error Logging System
 Logs all exceptions and errors to the logs directory for easier debugging.
 """
 
+import heapq
 import logging
+import os
 import sys
+import time
 import traceback
 from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+from core.systems.logger import (
+    BufferedFileHandler,
+    attach_queued_handlers,
+    stop_queued_handlers,
+)
+from ui.output import raw_print_scope
+
+# Root logger bound once; the helpers below log through it directly
+_root = logging.getLogger()
+
+# Project-level logs directory (resolved once at import)
+_LOGS_DIR = Path(__file__).resolve().parents[2] / "logs"
+
+# Each session's log files roll over at this size, keeping a few backups
+_MAX_LOG_BYTES = 5 * 1024 * 1024
+_LOG_BACKUP_COUNT = 5
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that can reuse the formatted timestamp within the same second.
+
+    Caching is opt-in (cache_time=True) and only applies when a datefmt is
+    given, since the default format includes milliseconds. Low-rate loggers
+    gain nothing from it and can leave it off.
+
+    The last formatted record is also remembered, so handlers that share one
+    formatter (the main and error logs) format each record only once.
+    """
+
+    def __init__(self, fmt=None, datefmt=None, *, cache_time: bool = False):
+        super().__init__(fmt, datefmt)
+        self.cache_time = cache_time
+        self._cached_time = (None, "")
+        self._last_formatted = (None, "")
+
+    def format(self, record):
+        last_record, text = self._last_formatted
+        if record is not last_record:
+            text = super().format(record)
+            self._last_formatted = (record, text)
+        return text
+
+    def formatTime(self, record, datefmt=None):  # noqa: N802
+        if not (self.cache_time and datefmt):
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, text)
+        return text
+
 
 def setup_error_logging():
     """
@@ -18,61 +76,79 @@ def setup_error_logging():
     Creates:
     - logs/game_YYYYMMDD_HHMMSS.log - Main game log
     - logs/errors_YYYYMMDD_HHMMSS.log - Error-only log
+
+    Both files are opened on their first record and rotate at
+    _MAX_LOG_BYTES (game_....log.1, ...).
     """
     # Create logs directory
-    logs_dir = Path(__file__).parent.parent.parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
+    _LOGS_DIR.mkdir(exist_ok=True)
 
     # Generate timestamp for log files
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Main log file (all messages)
-    main_log_file = logs_dir / f"game_{timestamp}.log"
+    main_log_file = _LOGS_DIR / f"game_{timestamp}.log"
 
     # Error log file (errors only)
-    error_log_file = logs_dir / f"errors_{timestamp}.log"
+    error_log_file = _LOGS_DIR / f"errors_{timestamp}.log"
 
     # Configure root logger
-    root_logger = logging.getLogger()
+    root_logger = _root
     root_logger.setLevel(logging.DEBUG)
 
-    # Remove any existing handlers
-    root_logger.handlers.clear()
+    # Remove any existing handlers (stopping a previous queue listener)
+    stop_queued_handlers(root_logger)
 
     # Create formatters
-    detailed_formatter = logging.Formatter(
+    detailed_formatter = CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
+        cache_time=True,
     )
 
-    simple_formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
+    simple_formatter = CachedTimeFormatter(
+        "%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%H:%M:%S",
+        cache_time=True,
     )
 
     # Main log file handler (all messages, DEBUG and above)
-    main_handler = logging.FileHandler(main_log_file, encoding="utf-8")
+    main_handler = BufferedFileHandler(
+        main_log_file,
+        encoding="utf-8",
+        delay=True,
+        max_bytes=_MAX_LOG_BYTES,
+        backup_count=_LOG_BACKUP_COUNT,
+    )
     main_handler.setLevel(logging.DEBUG)
     main_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(main_handler)
 
     # Error log file handler (errors only, ERROR and above)
-    error_handler = logging.FileHandler(error_log_file, encoding="utf-8")
+    error_handler = RotatingFileHandler(
+        error_log_file,
+        maxBytes=_MAX_LOG_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
 
     # Console handler (INFO and above, for user visibility)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
+
+    # Handlers run on a background listener so logging calls only enqueue;
+    # the console handler shares the queue so stdout stays in record order
+    attach_queued_handlers(root_logger, main_handler, error_handler, console_handler)
 
     # Log startup message
-    logging.info("=" * 70)
-    logging.info("Sheriff of Nottingham - Game Started")
-    logging.info(f"Main log: {main_log_file}")
-    logging.info(f"Error log: {error_log_file}")
-    logging.info("=" * 70)
+    _root.info("=" * 70)
+    _root.info("Sheriff of Nottingham - Game Started")
+    _root.info("Main log: %s", main_log_file)
+    _root.info("Error log: %s", error_log_file)
+    _root.info("=" * 70)
 
     return main_log_file, error_log_file
 
@@ -89,16 +165,20 @@ def log_exception(exc_type, exc_value, exc_traceback):
         return
 
     # Log the exception
-    logging.error("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
-
-    # Also print to stderr for immediate visibility
-    print("\n" + "=" * 70, file=sys.stderr)
-    print("ERROR: An exception occurred during gameplay", file=sys.stderr)
-    print("=" * 70, file=sys.stderr)
-    traceback.print_exception(exc_type, exc_value, exc_traceback, file=sys.stderr)
-    print("=" * 70, file=sys.stderr)
-    print("Check the logs directory for detailed error information.", file=sys.stderr)
-    print("=" * 70 + "\n", file=sys.stderr)
+    _root.error("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
+
+    # Also print to stderr for immediate visibility, bypassing the game UI
+    with raw_print_scope():
+        print("\n" + "=" * 70, file=sys.stderr)
+        print("ERROR: An exception occurred during gameplay", file=sys.stderr)
+        print("=" * 70, file=sys.stderr)
+        traceback.print_exception(exc_type, exc_value, exc_traceback, file=sys.stderr)
+        print("=" * 70, file=sys.stderr)
+        print(
+            "Check the logs directory for detailed error information.",
+            file=sys.stderr,
+        )
+        print("=" * 70 + "\n", file=sys.stderr)
 
 
 def install_exception_handler():
@@ -115,14 +195,22 @@ def log_game_event(event_type: str, message: str, **kwargs):
         message: Event message
         **kwargs: Additional context to log
     """
-    context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-    if context:
-        logging.info(f"[{event_type}] {message} | {context}")
+    # Skip building the context string when INFO is filtered out
+    if not _root.isEnabledFor(logging.INFO):
+        return
+    if kwargs:
+        context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
+        _root.info("[%s] %s | %s", event_type, message, context)
     else:
-        logging.info(f"[{event_type}] {message}")
+        _root.info("[%s] %s", event_type, message)
 
 
-def log_error(error_type: str, message: str, exception: Exception = None):
+def log_error(
+    error_type: str,
+    message: str,
+    exception: Exception = None,
+    with_traceback: bool = True,
+):
     """
     Log an error with context.
 
@@ -130,11 +218,23 @@ def log_error(error_type: str, message: str, exception: Exception = None):
         error_type: Type of error (e.g., 'portrait_load', 'merchant_load')
         message: Error message
         exception: Optional exception object
+        with_traceback: If False, log only the exception type and message
+            instead of formatting its traceback
     """
-    if exception:
-        logging.error(f"[{error_type}] {message}", exc_info=exception)
+    if not _root.isEnabledFor(logging.ERROR):
+        return
+    if exception and not with_traceback:
+        _root.error(
+            "[%s] %s: %s: %s",
+            error_type,
+            message,
+            type(exception).__name__,
+            exception,
+        )
+    elif exception:
+        _root.error("[%s] %s", error_type, message, exc_info=exception)
     else:
-        logging.error(f"[{error_type}] {message}")
+        _root.error("[%s] %s", error_type, message)
 
 
 def log_debug(component: str, message: str, **kwargs):
@@ -146,11 +246,20 @@ def log_debug(component: str, message: str, **kwargs):
         message: Debug message
         **kwargs: Additional debug context
     """
-    context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-    if context:
-        logging.debug(f"[{component}] {message} | {context}")
+    # Skip building the context string when DEBUG is filtered out
+    if not _root.isEnabledFor(logging.DEBUG):
+        return
+    if kwargs:
+        context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
+        _root.debug("[%s] %s | %s", component, message, context)
     else:
-        logging.debug(f"[{component}] {message}")
+        _root.debug("[%s] %s", component, message)
+
+
+def _is_log_name(name: str) -> bool:
+    """Match log files and their rotated backups (game_x.log, game_x.log.1)."""
+    base, _, index = name.rpartition(".")
+    return name.endswith(".log") or (base.endswith(".log") and index.isdigit())
 
 
 def cleanup_old_logs(keep_count: int = 10):
@@ -160,23 +269,31 @@ def cleanup_old_logs(keep_count: int = 10):
     Args:
         keep_count: Number of recent log files to keep
     """
-    logs_dir = Path(__file__).parent.parent.parent / "logs"
 
-    if not logs_dir.exists():
+    try:
+        with os.scandir(_LOGS_DIR) as it:
+            log_files = [e for e in it if _is_log_name(e.name) and e.is_file()]
+    except FileNotFoundError:
         return
 
-    # Get all log files sorted by modification time
-    log_files = sorted(
-        logs_dir.glob("*.log"), key=lambda p: p.stat().st_mtime, reverse=True
-    )
+    if len(log_files) <= keep_count:
+        return
+
+    # DirEntry caches its stat() result, so each file is stat'ed once
+    keep = {
+        e.path
+        for e in heapq.nlargest(keep_count, log_files, key=lambda e: e.stat().st_mtime)
+    }
 
     # Delete old files
-    for log_file in log_files[keep_count:]:
+    for log_file in log_files:
+        if log_file.path in keep:
+            continue
         try:
-            log_file.unlink()
-            logging.debug(f"Deleted old log file: {log_file.name}")
+            os.unlink(log_file.path)
+            _root.debug("Deleted old log file: %s", log_file.name)
         except Exception as e:
-            logging.warning(f"Failed to delete old log file {log_file.name}: {e}")
+            _root.warning("Failed to delete old log file %s: %s", log_file.name, e)
 
 
 # Convenience function to get logger for a module
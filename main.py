@@ -23,6 +23,7 @@ DO NOT add game logic here - put it in the appropriate manager file!
 import builtins
 import logging
 import os
+import sys
 import warnings
 
 import setup_env  # noqa: F401 - imported for side effects
@@ -41,7 +42,7 @@ from core.utils.error_logger import (
 
 # Local imports - UI (imports pygame, so must be after os.environ)
 from ui.menu import run_menu
-from ui.output import game_input, game_print
+from ui.output import flush_output, game_input, game_print, raw_print_scope
 from ui.pygame_ui import close_ui, get_ui
 
 # Initialize logging system
@@ -59,9 +60,7 @@ builtins.input = game_input
 
 if __name__ == "__main__":
     # Suppress Python warnings for clean output
-    import warnings
-
-    warnings.filterwarnings("ignore")
+    warnings.simplefilter("ignore")
 
     try:
         log_game_event("startup", "Initializing game")
@@ -91,20 +90,19 @@ if __name__ == "__main__":
             "\n[Game ended. Close the window to exit.]", clear_previous=False
         )
 
-        # Wait for window close
-        import pygame
-
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-            ui.clock.tick(60)
+        # Wait for window close; block on the event queue instead of polling.
+        # pygame is already loaded by ui.pygame_ui, so reuse that module
+        pygame = sys.modules["pygame"]
+        while pygame.event.wait().type != pygame.QUIT:
+            pass
 
         log_game_event("shutdown", "Game closed normally")
 
     except Exception as e:
         logging.error("Fatal error in main game loop", exc_info=e)
+        # Show game text still waiting in the output buffer before the report
+        with raw_print_scope():
+            flush_output()
         _original_print(f"\nFATAL ERROR: {e}")
         _original_print(f"Check logs directory for details: {main_log}")
         import traceback
@@ -112,6 +110,9 @@ if __name__ == "__main__":
         traceback.print_exc()
     finally:
         log_game_event("cleanup", "Cleaning up resources")
+        # The window is about to close, so anything unflushed goes to stdout
+        with raw_print_scope():
+            flush_output()
         close_ui()
         logging.info("=" * 70)
         logging.info("Sheriff of Nottingham - Session Ended")
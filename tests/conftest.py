@@ -7,9 +7,8 @@ Handles path configuration and common fixtures
 import os
 import sys
 import warnings
-from pathlib import Path
 
-import tests.test_setup  # noqa: F401
+from tests.test_setup import PROJECT_ROOT
 
 # Setup headless mode for all pygame tests - MUST be before pygame imports
 os.environ["SDL_VIDEODRIVER"] = "dummy"
@@ -21,20 +20,11 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 # See: https://github.com/pygame/pygame/issues/3307
 warnings.filterwarnings("ignore", category=UserWarning, module="pygame.pkgdata")
 
-# Add project root to Python path
-# This file is at: tests/conftest.py
-# Project root is 1 level up
-project_root = Path(__file__).resolve().parent.parent
-
-# Insert at beginning of path if not already there
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-# Also ensure we can import from the installed package
+# tests.test_setup has already put the project root on sys.path
 
 
 def pytest_configure(config):
     """Called after command line options have been parsed."""
     # Ensure project root is in path
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
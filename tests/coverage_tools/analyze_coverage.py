@@ -5,23 +5,22 @@ Coverage Analysis Tool
 Analyzes test coverage and identifies areas needing more tests.
 """
 
-# Must be first import - sets up test environment
 import contextlib
 import subprocess
 import sys
-from pathlib import Path
 
-import tests.test_setup  # noqa: F401
+# Also sets up the test environment
+from tests.test_setup import PROJECT_ROOT
 
-# Get project root
-project_root = Path(__file__).parent.parent.parent
+# Section rule for console reports
+SEP = "=" * 70
 
 
 def run_coverage():
     """Run tests with coverage and generate report."""
-    print("=" * 70)
+    print(SEP)
     print("RUNNING TESTS WITH COVERAGE")
-    print("=" * 70)
+    print(SEP)
     print()
 
     # Run tests with coverage
@@ -42,9 +41,9 @@ def run_coverage():
         print("⚠️  Some tests failed, but continuing with coverage analysis...")
 
     print()
-    print("=" * 70)
+    print(SEP)
     print("COVERAGE REPORT")
-    print("=" * 70)
+    print(SEP)
     print()
 
     # Generate coverage report
@@ -73,9 +72,9 @@ def run_coverage():
 
     # Analyze coverage
     print()
-    print("=" * 70)
+    print(SEP)
     print("COVERAGE ANALYSIS")
-    print("=" * 70)
+    print(SEP)
     print()
 
     # Files with low coverage (< 80%)
@@ -107,9 +106,9 @@ def run_coverage():
         int((total_stmts - total_miss) / total_stmts * 100) if total_stmts > 0 else 0
     )
 
-    print("=" * 70)
+    print(SEP)
     print("OVERALL STATISTICS")
-    print("=" * 70)
+    print(SEP)
     print()
     print(f"Total statements: {total_stmts}")
     print(f"Covered: {total_stmts - total_miss}")
@@ -128,14 +127,14 @@ def run_coverage():
     print()
 
     # Generate HTML report
-    print("=" * 70)
+    print(SEP)
     print("GENERATING HTML REPORT")
-    print("=" * 70)
+    print(SEP)
     print()
 
     subprocess.run([sys.executable, "-m", "coverage", "html"], capture_output=True)
 
-    html_report = project_root / "coverage_html_report" / "index.html"
+    html_report = PROJECT_ROOT / "coverage_html_report" / "index.html"
     if html_report.exists():
         print(f"✅ HTML report generated: {html_report}")
         print(f"   Open in browser: file://{html_report}")
@@ -5,88 +5,148 @@ Test Runner with Coverage
 Runs all tests and generates coverage report.
 """
 
-# Must be first import - sets up test environment
+import importlib.util
+import os
 import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-import tests.test_setup  # noqa: F401
+# Also sets up the test environment
+from tests.test_setup import PROJECT_ROOT
 
-# Get project root
-project_root = Path(__file__).parent.parent.parent
+# Section rule for console reports
+SEP = "=" * 70
+
+# Seconds allowed per test file; the whole run's timeout scales with it
+PER_FILE_TIMEOUT = 30
+
+# Demo files that are not part of the test suite
+EXCLUDE_FILES = ("tests/demos/test_image_display.py",)
+
+
+def build_pytest_command(tests_dir):
+    """Build one pytest command that shards the suite across all cores.
+
+    pytest-xdist's loadfile scheduler keeps each module on a single worker,
+    so tests still run file by file, just concurrently.
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        str(tests_dir),
+        "-n",
+        "auto",
+        "--dist",
+        "loadfile",
+        "-q",
+    ]
+    command += [f"--ignore={PROJECT_ROOT / path}" for path in EXCLUDE_FILES]
+    return command
+
+
+def iter_test_files(tests_dir):
+    """Yield test files under tests_dir as rglob finds them, skipping excludes."""
+    excluded = {PROJECT_ROOT / path for path in EXCLUDE_FILES}
+    return (f for f in tests_dir.rglob("test_*.py") if f not in excluded)
 
 
 def run_test_file(test_file):
-    """Run a single test file."""
+    """Run a single test file with pytest in its own process.
+
+    Each file gets a fresh interpreter, so no imports or global state carry
+    over between files, and a hung file is killed after PER_FILE_TIMEOUT.
+    Returns (success, summary), where summary is the last line pytest printed.
+    """
     try:
         result = subprocess.run(
-            [sys.executable, str(test_file)], capture_output=True, text=True, timeout=30
+            [sys.executable, "-m", "pytest", str(test_file), "-q"],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=PER_FILE_TIMEOUT,
         )
-        return result.returncode == 0, result.stdout, result.stderr
+        lines = result.stdout.rstrip().rsplit("\n", 1)
+        # Exit code 5 means the file holds helpers only and collected no tests
+        return result.returncode in (0, 5), lines[-1]
     except subprocess.TimeoutExpired:
-        return False, "", "Test timed out"
+        return False, "Test timed out"
     except Exception as e:
-        return False, "", str(e)
+        return False, str(e)
+
+
+def run_files_concurrently(test_files):
+    """Run test files in parallel worker processes (no pytest-xdist needed).
+
+    Files are submitted as they are yielded, so the first ones start running
+    while the tree is still being walked. Leaves two cores free for the
+    foreground. Returns (passed, failed) file counts.
+    """
+    workers = max(1, (os.cpu_count() or 1) - 2)
+    passed = failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_test_file, f): f for f in test_files}
+        for future in as_completed(futures):
+            name = futures[future].relative_to(PROJECT_ROOT)
+            success, summary = future.result()
+            if success:
+                passed += 1
+                print(f"✅ PASSED: {name}")
+            else:
+                failed += 1
+                print(f"❌ FAILED: {name}")
+                if summary:
+                    print(f"  {summary[:200]}")
+    return passed, failed
 
 
 def main():
     """Run all tests and report results."""
-    print("=" * 70)
+    print(SEP)
     print("RUNNING ALL TESTS")
-    print("=" * 70)
+    print(SEP)
     print()
 
-    # Find all test files
-    tests_dir = project_root / "tests"
-    test_files = list(tests_dir.glob("test_*.py"))
+    tests_dir = PROJECT_ROOT / "tests"
 
-    # Exclude certain test files
-    exclude_files = {"test_image_display.py"}  # Demo files
-    test_files = [f for f in test_files if f.name not in exclude_files]
+    if importlib.util.find_spec("xdist") is None:
+        print("pytest-xdist not installed; running files in worker processes")
+        print()
+        passed, failed = run_files_concurrently(iter_test_files(tests_dir))
+        print(f"\n{passed} passed, {failed} failed")
+        return _print_summary(1 if failed else 0)
 
-    print(f"Found {len(test_files)} test files:")
-    for test_file in test_files:
-        print(f"  - {test_file.name}")
+    file_count = sum(1 for _ in iter_test_files(tests_dir))
+    print(f"Found {file_count} test files under {tests_dir}")
     print()
 
-    # Run each test
-    results = []
-    for test_file in test_files:
-        print(f"Running {test_file.name}...")
-        success, stdout, stderr = run_test_file(test_file)
-        results.append((test_file.name, success))
-
-        if not success:
-            print("  ❌ FAILED")
-            if stderr:
-                print(f"  Error: {stderr[:200]}")
-        else:
-            print("  ✅ PASSED")
-
-    # Summary
-    print()
-    print("=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
+    command = build_pytest_command(tests_dir)
+    try:
+        result = subprocess.run(
+            command, cwd=PROJECT_ROOT, timeout=PER_FILE_TIMEOUT * file_count
+        )
+        returncode = result.returncode
+    except subprocess.TimeoutExpired:
+        print("❌ Test run timed out")
+        returncode = 1
 
-    passed = sum(1 for _, success in results if success)
-    failed = len(results) - passed
+    return _print_summary(returncode)
 
-    for test_name, success in results:
-        status = "✅ PASSED" if success else "❌ FAILED"
-        print(f"{status}: {test_name}")
 
+def _print_summary(returncode):
+    """Print the final summary and return the process exit code."""
     print()
-    print(f"Total: {len(results)} tests")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
+    print(SEP)
+    print("TEST SUMMARY")
+    print(SEP)
     print()
 
-    if failed == 0:
+    if returncode == 0:
         print("✅ ALL TESTS PASSED!")
         return 0
     else:
-        print(f"❌ {failed} TEST(S) FAILED")
+        print(f"❌ TESTS FAILED (exit code {returncode})")
         return 1
 
 
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for core integration tests.
+
+The session-scoped mocks are built once and handed to every test that only
+passes them through to the code under test. Tests that configure or assert
+on a mock should build their own, since calls recorded here are shared.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from core.players.sheriff import Sheriff
+from core.systems.game_stats import GameStats
+
+
+@pytest.fixture(scope="session")
+def base_sheriff_mock():
+    """Opaque Sheriff stand-in, built once per session."""
+    return Mock(spec=Sheriff)
+
+
+@pytest.fixture(scope="session")
+def base_stats_mock():
+    """Opaque GameStats stand-in, built once per session."""
+    return Mock(spec=GameStats)
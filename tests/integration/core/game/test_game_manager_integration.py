@@ -3,78 +3,78 @@ Integration tests extracted from test_game_manager_complete.py
 """
 
 # Must be first import - sets up test environment
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 import tests.test_setup  # noqa: F401
 from core.game.game_manager import run_game
 
+# Collaborators replaced for run_game, grouped by the module they are looked up in
+# so each module is patched in one patch.multiple call
+_PATCHED = {
+    "core.game.game_manager": (
+        "print_intro",
+        "load_merchants",
+        "reset_game_master_state",
+        "get_game_master_state",
+        "show_end_game_summary",
+        "process_pass_without_inspection",
+        "record_encounter",
+        "update_sheriff_reputation",
+    ),
+    "core.game.encounter_processor": (
+        "update_stats_bar",
+        "narrate_arrival",
+        "build_bag_and_declaration",
+        "choose_tell",
+        "show_declaration",
+        "prompt_initial_decision",
+    ),
+}
+
 
 class TestRunGameIntegration:
     """Integration tests for run_game"""
 
-    @patch(
-        "core.game.encounter_processor.GOOD_BY_ID", {"apple": Mock(id="apple", value=5)}
+    @patch.multiple(
+        "core.game.encounter_processor",
+        GOOD_BY_ID={"apple": Mock(id="apple", value=5)},
+        **dict.fromkeys(_PATCHED["core.game.encounter_processor"], DEFAULT),
+    )
+    @patch.multiple(
+        "core.game.game_manager",
+        **dict.fromkeys(_PATCHED["core.game.game_manager"], DEFAULT),
     )
-    @patch("core.game.game_manager.record_encounter")
-    @patch("core.game.game_manager.process_pass_without_inspection")
-    @patch("core.game.encounter_processor.prompt_initial_decision")
-    @patch("core.game.encounter_processor.show_declaration")
-    @patch("core.game.encounter_processor.choose_tell")
-    @patch("core.game.encounter_processor.build_bag_and_declaration")
-    @patch("core.game.encounter_processor.narrate_arrival")
-    @patch("core.game.encounter_processor.update_stats_bar")
-    @patch("core.game.game_manager.show_end_game_summary")
-    @patch("core.game.game_manager.get_game_master_state")
-    @patch("core.game.game_manager.reset_game_master_state")
-    @patch("core.game.game_manager.load_merchants")
-    @patch("core.game.game_manager.print_intro")
-    def test_run_game_multiple_merchants(
-        self,
-        mock_intro,
-        mock_load,
-        mock_reset,
-        mock_get_state,
-        mock_summary,
-        mock_update,
-        mock_narrate,
-        mock_build,
-        mock_choose_tell,
-        mock_show_decl,
-        mock_prompt,
-        mock_process_pass,
-        mock_record,
-    ):
+    def test_run_game_multiple_merchants(self, **mocks):
         """Test run_game with multiple merchants"""
-        # Setup 3 merchants
-        merchants = [
-            Mock(
-                name=f"Merchant{i}",
-                should_offer_proactive_bribe=Mock(return_value=False),
-            )
-            for i in range(3)
-        ]
-        mock_load.return_value = merchants
+        # Setup 3 merchants; run_game only counts turns, so one template
+        # merchant can take all three
+        merchant = Mock()
+        merchant.should_offer_proactive_bribe.return_value = False
+        mocks["load_merchants"].return_value = [merchant] * 3
 
         mock_game_state = Mock()
-        mock_get_state.return_value = mock_game_state
+        mocks["get_game_master_state"].return_value = mock_game_state
 
         mock_declaration = Mock()
         mock_declaration.good_id = "apple"
         mock_declaration.count = 2
         mock_goods = []
-        mock_build.return_value = (mock_declaration, mock_goods, True)
+        mocks["build_bag_and_declaration"].return_value = (
+            mock_declaration,
+            mock_goods,
+            True,
+        )
 
-        mock_choose_tell.return_value = ""
-        mock_prompt.return_value = "pass"
-        mock_process_pass.return_value = (True, False)
+        mocks["choose_tell"].return_value = ""
+        mocks["prompt_initial_decision"].return_value = "pass"
+        mocks["process_pass_without_inspection"].return_value = (True, False)
 
         # Run game
-        with patch("core.game.game_manager.update_sheriff_reputation"):
-            run_game()
+        run_game()
 
         # Verify all merchants were processed
-        assert mock_narrate.call_count == 3
-        assert mock_build.call_count == 3
-        assert mock_process_pass.call_count == 3
-        assert mock_record.call_count == 3
-        mock_summary.assert_called_once()
+        assert mocks["narrate_arrival"].call_count == 3
+        assert mocks["build_bag_and_declaration"].call_count == 3
+        assert mocks["process_pass_without_inspection"].call_count == 3
+        assert mocks["record_encounter"].call_count == 3
+        mocks["show_end_game_summary"].assert_called_once()
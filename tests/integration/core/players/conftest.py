@@ -0,0 +1,40 @@
+"""
+Shared fixtures for player integration tests.
+"""
+
+import pytest
+
+from core.players.silas_voss import SilasVoss
+
+
+@pytest.fixture(scope="module")
+def silas():
+    """One Silas instance per test module; _reset_silas clears it between tests."""
+    silas = SilasVoss(
+        id="silas",
+        name="Silas Voss",
+        intro="Information Broker",
+        tells_honest=["calm"],
+        tells_lying=["nervous"],
+        bluff_skill=8,
+        risk_tolerance=6,
+        greed=7,
+        honesty_bias=5,
+    )
+    silas._rng.seed(0)
+    return silas
+
+
+@pytest.fixture(autouse=True)
+def _reset_silas(request):
+    """Drop the hand and caches a test left on the shared Silas and reseed it."""
+    yield
+    if "silas" not in request.fixturenames:
+        return
+    silas = request.getfixturevalue("silas")
+    silas.hand = []
+    # Fall back to the class-level empty caches
+    vars(silas).pop("_sheriff_type_cache", None)
+    vars(silas).pop("_bribe_ratio_cache", None)
+    # Every test sees the same random sequence, whatever ran before it
+    silas._rng.seed(0)
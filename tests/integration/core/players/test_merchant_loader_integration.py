@@ -3,10 +3,34 @@ Integration tests extracted from test_merchant_loader_comprehensive.py
 """
 
 # Must be first import - sets up test environment
-from unittest.mock import Mock, mock_open, patch
+from collections import namedtuple
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
 
 import tests.test_setup  # noqa: F401
-from core.players.merchant_loader import load_merchants
+from core.players.merchant_loader import _read_merchant_file, load_merchants
+
+# load_merchants only reads .stem and .name from the globbed paths
+FakeFile = namedtuple("FakeFile", "stem name")
+
+_MERCHANTS_DATA = (
+    {
+        "id": "alice",
+        "name": "Alice Baker",
+        "intro": "A baker",
+        "bluff_skill": 5,
+        "role": None,
+    },
+    {
+        "id": "silas",
+        "name": "Silas Voss",
+        "intro": "A broker",
+        "bluff_skill": 8,
+        "role": "broker",
+    },
+)
+
+_MOCK_FILES = (FakeFile("alice", "alice.json"), FakeFile("silas", "silas.json"))
 
 
 class TestLoadMerchantsIntegration:
@@ -14,43 +38,24 @@ class TestLoadMerchantsIntegration:
 
     @patch("core.players.merchant_loader.log_debug")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_complete_loading_workflow(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_debug
     ):
         """Test complete merchant loading workflow"""
-        merchants_data = [
-            {
-                "id": "alice",
-                "name": "Alice Baker",
-                "intro": "A baker",
-                "bluff_skill": 5,
-                "role": None,
-            },
-            {
-                "id": "silas",
-                "name": "Silas Voss",
-                "intro": "A broker",
-                "bluff_skill": 8,
-                "role": "broker",
-            },
-        ]
-
-        mock_files = [
-            Mock(stem="alice", name="alice.json"),
-            Mock(stem="silas", name="silas.json"),
-        ]
+        # The fake paths are the same every run, so start from an empty cache
+        _read_merchant_file.cache_clear()
 
         mock_data_dir = Mock()
         mock_data_dir.exists.return_value = True
-        mock_data_dir.glob.return_value = mock_files
+        mock_data_dir.glob.return_value = list(_MOCK_FILES)
 
         mock_path = Mock()
         mock_path.__truediv__ = Mock(return_value=mock_data_dir)
         mock_chars_dir.return_value = mock_path
 
-        with patch("json.load", side_effect=merchants_data):
+        with patch("json.load", side_effect=list(_MERCHANTS_DATA)):
             result = load_merchants()
 
         assert len(result) == 2
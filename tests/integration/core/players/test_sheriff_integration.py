@@ -3,6 +3,8 @@ Integration tests extracted from test_sheriff.py
 """
 
 # Must be first import - sets up test environment
+import pytest
+
 import tests.test_setup  # noqa: F401
 from core.players.sheriff import Sheriff
 
@@ -26,14 +28,15 @@ class TestSheriffIntegration:
         sheriff.authority += 1
         assert sheriff.authority == 2
 
-    def test_multiple_sheriffs(self):
-        """Test creating multiple Sheriff instances"""
+    @pytest.mark.parametrize("reputation", [5, 8])
+    def test_sheriff_reputation(self, reputation):
+        """Test each Sheriff keeps the reputation it was created with"""
+        assert Sheriff(reputation=reputation).reputation == reputation
+
+    def test_sheriffs_are_independent(self):
+        """Test Sheriff instances do not share state"""
         sheriff1 = Sheriff(reputation=5)
         sheriff2 = Sheriff(reputation=8)
 
-        assert sheriff1.reputation == 5
-        assert sheriff2.reputation == 8
-
-        # They should be independent
         sheriff1.reputation = 3
         assert sheriff2.reputation == 8
@@ -6,32 +6,43 @@ Integration tests extracted from test_pygame_ui.py
 from unittest.mock import Mock
 
 import pygame
+import pytest
 
 import tests.test_setup  # noqa: F401
 from ui.pygame_ui import VisualNovelUI, close_ui, get_ui
 
 
+@pytest.fixture(scope="module")
+def ui():
+    """One UI (and one SDL window) shared by every test in this module."""
+    pygame.init()
+    yield get_ui()
+    close_ui()
+    pygame.quit()
+
+
 class TestVisualNovelUIIntegration:
     """Integration tests for VisualNovelUI"""
 
-    def test_full_ui_workflow(self):
+    def test_full_ui_workflow(self, ui, monkeypatch):
         """Test complete UI workflow"""
-        pygame.init()
-
-        ui = get_ui()
+        # Stub components through monkeypatch so the shared UI is restored
+        for component, method in (
+            (ui.text, "display_text"),
+            (ui.stats_bar, "update"),
+            (ui.stats_bar, "render"),
+            (ui.text, "render"),
+            (ui.price_menu, "render"),
+        ):
+            monkeypatch.setattr(component, method, Mock())
 
         # Display text
-        ui.text.display_text = Mock()
         ui.display_text("Hello", clear_previous=True, animate=False)
 
         # Update stats
-        ui.stats_bar.update = Mock()
         ui.update_stats(merchant_count=1, total_merchants=10)
 
         # Render
-        ui.stats_bar.render = Mock()
-        ui.text.render = Mock()
-        ui.price_menu.render = Mock()
         ui.render()
 
         # Verify all calls
@@ -41,20 +52,12 @@ class TestVisualNovelUIIntegration:
         ui.text.render.assert_called_once()
         ui.price_menu.render.assert_called_once()
 
-        close_ui()
-        pygame.quit()
-
-    def test_ui_component_coordination(self):
+    def test_ui_component_coordination(self, ui):
         """Test that UI components work together"""
-        pygame.init()
-
-        ui = VisualNovelUI()
+        assert isinstance(ui, VisualNovelUI)
 
         # Verify components are connected
         assert ui.text.window == ui.window
         assert ui.input.window == ui.window
         assert ui.input.text_display == ui.text
         assert ui.input.price_menu == ui.price_menu
-
-        ui.close()
-        pygame.quit()
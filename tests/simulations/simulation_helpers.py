@@ -18,6 +18,127 @@ from core.players.sheriff import Sheriff
 from core.systems.game_master_state import get_game_master_state
 
 
+def make_encounter_simulator() -> callable:
+    """
+    Build an encounter simulator bound to the current game master state.
+
+    The state's record_event method is looked up once here rather than once per
+    encounter, so batch runners should call this once per batch, after
+    reset_game_master_state() (a reset replaces the state the closure holds).
+
+    Returns:
+        Callable with the same signature and result as simulate_encounter.
+    """
+    record_event = get_game_master_state().record_event
+
+    def _simulate(
+        merchant: Merchant,
+        sheriff: Sheriff,
+        sheriff_strategy: callable,
+        history: list[dict],
+    ) -> dict:
+        # Build bag and declaration
+        declaration, actual_goods, is_honest = build_bag_and_declaration(
+            merchant, history
+        )
+
+        # Get declared goods (the bribe methods compare and sum it as a list)
+        declared_good = GOOD_BY_ID[declaration.good_id]
+        declared_goods = [declared_good] * declaration.count
+
+        # One pass over the bag for the ids and base values used below
+        actual_good_ids = []
+        goods_value = 0
+        contraband_value = 0
+        for g in actual_goods:
+            value = g.value
+            goods_value += value
+            actual_good_ids.append(g.id)
+            if not g.is_legal():
+                contraband_value += value
+
+        # Check if merchant offers proactive bribe
+        bribe_offered = 0
+        if merchant.should_offer_proactive_bribe(
+            sheriff.authority, sheriff.reputation, actual_goods, declared_goods
+        ):
+            bribe_offered = merchant.calculate_proactive_bribe(
+                actual_goods, not is_honest, sheriff.authority, declared_goods
+            )
+
+        # Sheriff decides what to do
+        should_inspect, accept_bribe = sheriff_strategy(
+            merchant, bribe_offered, declaration, actual_goods, history
+        )
+
+        # Process outcome
+        gold_earned = 0
+        gold_lost = 0
+        caught = False
+
+        if accept_bribe:
+            # Sheriff accepted bribe - merchant pays bribe and keeps goods
+            gold_lost += bribe_offered
+            # Apply contraband set bonuses!
+            bonus_result = calculate_contraband_bonus(actual_goods)
+            gold_earned += bonus_result["bonus_value"]
+        elif should_inspect:
+            # Sheriff inspects - NO bribe is paid (inspection instead of bribe)
+            if not is_honest:
+                # Caught lying!
+                caught = True
+                # Pay fine (double contraband value)
+                # Use BASE value for penalty, not bonus
+                gold_lost += contraband_value * 2
+                # Bribe is NOT paid when inspected
+            else:
+                # Honest, goods pass
+                # RULE: Sheriff pays merchant the goods' value for wrongful inspection
+                # Use base value for penalty (sheriff doesn't pay bonuses)
+                gold_earned += goods_value  # Keep the goods
+                gold_earned += goods_value  # Sheriff pays penalty (DOUBLE profit!)
+                # Bribe is NOT paid when inspected
+        else:
+            # Sheriff lets pass without inspection (no bribe was offered)
+            # Apply contraband set bonuses!
+            bonus_result = calculate_contraband_bonus(actual_goods)
+            gold_earned += bonus_result["bonus_value"]
+
+        result = {
+            "merchant_name": merchant.name,
+            "gold_earned": gold_earned,
+            "gold_lost": gold_lost,
+            "caught": caught,
+            "passed": not caught,
+            "bribe_attempted": bribe_offered > 0,  # Did they try to bribe?
+            "bribe_offered": bribe_offered,  # Amount offered (for Silas detection)
+            "bribed": accept_bribe,  # Did sheriff accept?
+            "bribe_accepted": accept_bribe,  # Alias for compatibility
+            "contraband": not is_honest,
+            "opened": should_inspect,
+            "caught_lie": caught,
+        }
+
+        # CRITICAL FOR SILAS VOSS: Record encounter to game master state
+        # Silas's sheriff detection relies on this history. Without it, he will
+        # always detect sheriffs as "unknown" and perform significantly worse.
+        record_event(
+            merchant_name=merchant.name,
+            declared_good=declared_good.id,
+            declared_count=declaration.count,
+            actual_goods=actual_good_ids,
+            was_opened=should_inspect,
+            caught_lie=caught,
+            bribe_offered=bribe_offered,
+            bribe_accepted=accept_bribe,
+            proactive_bribe=bribe_offered > 0,
+        )
+
+        return result
+
+    return _simulate
+
+
 def simulate_encounter(
     merchant: Merchant,
     sheriff: Sheriff,
@@ -57,96 +178,7 @@ def simulate_encounter(
             - opened: bool
             - caught_lie: bool
     """
-    # Build bag and declaration
-    declaration, actual_goods, is_honest = build_bag_and_declaration(merchant, history)
-
-    # Get declared goods
-    declared_good = GOOD_BY_ID[declaration.good_id]
-    declared_goods = [declared_good] * declaration.count
-
-    # Check if merchant offers proactive bribe
-    bribe_offered = 0
-    if merchant.should_offer_proactive_bribe(
-        sheriff.authority, sheriff.reputation, actual_goods, declared_goods
-    ):
-        bribe_offered = merchant.calculate_proactive_bribe(
-            actual_goods, not is_honest, sheriff.authority, declared_goods
-        )
-
-    # Sheriff decides what to do
-    should_inspect, accept_bribe = sheriff_strategy(
-        merchant, bribe_offered, declaration, actual_goods, history
-    )
-
-    # Process outcome
-    gold_earned = 0
-    gold_lost = 0
-    caught = False
-
-    if accept_bribe:
-        # Sheriff accepted bribe - merchant pays bribe and keeps goods
-        gold_lost += bribe_offered
-        # Apply contraband set bonuses!
-        bonus_result = calculate_contraband_bonus(actual_goods)
-        gold_earned += bonus_result["bonus_value"]
-    elif should_inspect:
-        # Sheriff inspects - NO bribe is paid (inspection instead of bribe)
-        if not is_honest:
-            # Caught lying!
-            caught = True
-            # Pay fine (double contraband value) - use BASE value for penalty, not bonus
-            contraband_value = sum(g.value for g in actual_goods if not g.is_legal())
-            gold_lost += contraband_value * 2
-            # Bribe is NOT paid when inspected
-        else:
-            # Honest, goods pass
-            # RULE: Sheriff must pay merchant the value of goods for wrongful inspection
-            # Use base value for penalty calculation (sheriff doesn't pay bonuses)
-            goods_value = sum(g.value for g in actual_goods)
-            gold_earned += goods_value  # Keep the goods
-            gold_earned += goods_value  # Sheriff pays penalty (DOUBLE profit!)
-            # Bribe is NOT paid when inspected
-    else:
-        # Sheriff lets pass without inspection (no bribe was offered)
-        # Apply contraband set bonuses!
-        bonus_result = calculate_contraband_bonus(actual_goods)
-        gold_earned += bonus_result["bonus_value"]
-
-    result = {
-        "merchant_name": merchant.name,
-        "gold_earned": gold_earned,
-        "gold_lost": gold_lost,
-        "caught": caught,
-        "passed": not caught,
-        "bribe_attempted": bribe_offered > 0,  # Did they try to bribe?
-        "bribe_offered": bribe_offered,  # Amount offered (for Silas detection)
-        "bribed": accept_bribe,  # Did sheriff accept?
-        "bribe_accepted": accept_bribe,  # Alias for compatibility
-        "contraband": not is_honest,
-        "opened": should_inspect,
-        "caught_lie": caught,
-    }
-
-    # CRITICAL FOR SILAS VOSS: Record encounter to game master state
-    # Silas's sheriff detection relies on this history. Without it, he will
-    # always detect sheriffs as "unknown" and perform significantly worse.
-    game_state = get_game_master_state()
-
-    # Record event using proper method
-    actual_good_ids = [g.id for g in actual_goods]
-    game_state.record_event(
-        merchant_name=merchant.name,
-        declared_good=declared_good.id,
-        declared_count=declaration.count,
-        actual_goods=actual_good_ids,
-        was_opened=should_inspect,
-        caught_lie=caught,
-        bribe_offered=bribe_offered,
-        bribe_accepted=accept_bribe,
-        proactive_bribe=bribe_offered > 0,
-    )
-
-    return result
+    return make_encounter_simulator()(merchant, sheriff, sheriff_strategy, history)
 
 
 def record_round_to_game_state(
@@ -178,7 +210,9 @@ def record_round_to_game_state(
         from tests.simulations.simulation_helpers import record_round_to_game_state
 
         # In your test loop:
-        declaration, actual_goods, is_honest = build_bag_and_declaration(merchant, history)
+        declaration, actual_goods, is_honest = build_bag_and_declaration(
+            merchant, history
+        )
         bribe_offered = merchant.calculate_proactive_bribe(...) if merchant.should_offer_proactive_bribe(...) else 0
         should_inspect, accept_bribe = sheriff_strategy(...)
 
@@ -222,8 +256,6 @@ def record_round_to_game_state(
                 )
         ```
     """
-    from core.systems.game_master_state import get_game_master_state
-
     game_state = get_game_master_state()
     actual_good_ids = [g.id for g in actual_goods]
 
@@ -8,20 +8,15 @@ Tests two extreme merchant personalities:
 This helps us understand the boundaries of the strategy system.
 """
 
-# Must be first import - sets up test environment
 import json
-from pathlib import Path
 
-import tests.test_setup  # noqa: F401
 from ai_strategy.ai_sheriffs import corrupt_greedy, smart_adaptive, trigger_happy
 from core.mechanics.goods import GOOD_BY_ID
 from core.players.merchants import Merchant
 from tests.simulations.test_merchant_performance import (
     MerchantStats,
 )
-
-# Get project root
-project_root = Path(__file__).parent.parent.parent
+from tests.test_setup import PROJECT_ROOT
 
 
 def load_test_merchants():
@@ -30,7 +25,7 @@ def load_test_merchants():
     merchants = []
 
     # Load Honest Abe
-    abe_path = project_root / "characters" / "data" / "test_honest_abe.json"
+    abe_path = PROJECT_ROOT / "characters" / "data" / "test_honest_abe.json"
     with open(abe_path) as f:
         abe_data = json.load(f)
         abe = Merchant(
@@ -47,7 +42,7 @@ def load_test_merchants():
         merchants.append(abe)
 
     # Load Lying Larry
-    larry_path = project_root / "characters" / "data" / "test_lying_larry.json"
+    larry_path = PROJECT_ROOT / "characters" / "data" / "test_lying_larry.json"
     with open(larry_path) as f:
         larry_data = json.load(f)
         larry = Merchant(
@@ -17,6 +17,7 @@ to game state, Silas will always detect sheriffs as "unknown" and his performanc
 significantly worse.
 """
 
+import sys
 from dataclasses import dataclass
 
 from ai_strategy.ai_sheriffs import (
@@ -29,15 +30,14 @@ from ai_strategy.ai_sheriffs import (
     vengeful,
 )
 from core.players.merchant_loader import load_merchants
-from core.players.merchants import Merchant
 from core.players.sheriff import Sheriff
 from core.systems.game_master_state import reset_game_master_state
 
-# Import simulate_encounter helper (works for both pytest and direct script execution)
+# Import encounter simulator factory (works for pytest and direct script execution)
 try:
-    from tests.simulations.simulation_helpers import simulate_encounter
+    from tests.simulations.simulation_helpers import make_encounter_simulator
 except ModuleNotFoundError:
-    from simulation_helpers import simulate_encounter
+    from simulation_helpers import make_encounter_simulator
 
 
 @dataclass
@@ -83,8 +83,9 @@ def run_simulation(
     # Initialize sheriff
     sheriff = Sheriff(reputation=5, authority=2)
 
-    # Reset game state
+    # Reset game state, then bind the simulator to the fresh state
     reset_game_master_state()
+    simulate_encounter = make_encounter_simulator()
     history = []
 
     # Run rounds
@@ -124,17 +125,16 @@ def run_simulation(
 
 def print_results(sheriff_name: str, stats: dict[str, MerchantStats]):
     """Print simulation results in a nice format."""
-    print(f"\n{'=' * 80}")
-    print(f"SIMULATION RESULTS: {sheriff_name}")
-    print(f"{'=' * 80}")
+    rule = "=" * 80
+    out = ["", rule, f"SIMULATION RESULTS: {sheriff_name}", rule]
 
     # Sort by net profit
     sorted_merchants = sorted(stats.values(), key=lambda s: s.net_profit, reverse=True)
 
-    print(
+    out.append(
         f"\n{'Merchant':<25} {'Net Profit':<12} {'Success':<10} {'Caught':<8} {'Bribe Try':<11} {'Accepted':<10}"
     )
-    print(f"{'-' * 90}")
+    out.append("-" * 90)
 
     for merchant_stats in sorted_merchants:
         bribe_success_rate = (
@@ -142,7 +142,7 @@ def print_results(sheriff_name: str, stats: dict[str, MerchantStats]):
             if merchant_stats.bribes_attempted > 0
             else 0
         )
-        print(
+        out.append(
             f"{merchant_stats.name:<25} "
             f"{merchant_stats.net_profit:>10}g  "
             f"{merchant_stats.success_rate:>7.1%}  "
@@ -151,11 +151,14 @@ def print_results(sheriff_name: str, stats: dict[str, MerchantStats]):
             f"{merchant_stats.bribes_accepted:>8} ({bribe_success_rate:>3.0f}%)"
         )
 
-    print(f"\n{'=' * 80}")
-    print(
+    out.append(f"\n{rule}")
+    out.append(
         f"Winner: {sorted_merchants[0].name} with {sorted_merchants[0].net_profit}g profit!"
     )
-    print(f"{'=' * 80}\n")
+    out.append(f"{rule}\n")
+
+    # One write for the whole table instead of a print per row
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
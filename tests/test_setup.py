@@ -13,9 +13,13 @@ import os
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Project root, resolved once; test modules import it rather than walking
+# Path(__file__).parent chains of their own
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Add project root to path (once; tests/conftest.py may already have done it)
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 # Setup headless mode for pygame (must be before pygame import)
 os.environ["SDL_VIDEODRIVER"] = "dummy"
@@ -86,6 +86,118 @@ class TestGameMasterState(unittest.TestCase):
         self.assertEqual(history[0]["merchant_name"], "merchant_a")
         self.assertEqual(history[1]["merchant_name"], "merchant_a")
 
+    def test_sheriff_stats_from_columns(self):
+        """Test sheriff stats are summed from the per-field columns."""
+        gms = GameMasterState()
+
+        gms.record_event("merchant_a", "apple", 5, ["apple"], True, True, 10, False)
+        gms.record_event("merchant_b", "apple", 5, ["apple"], False, False, 0)
+        gms.record_event("merchant_c", "apple", 5, ["silk"], False, False, 15, True)
+
+        self.assertEqual(gms.was_opened, [True, False, False])
+        stats = gms.get_sheriff_stats()
+
+        self.assertEqual(stats["total_encounters"], 3)
+        self.assertEqual(stats["total_inspections"], 1)
+        self.assertEqual(stats["total_catches"], 1)
+        self.assertEqual(stats["bribes_offered"], 2)
+        self.assertEqual(stats["bribes_accepted"], 1)
+
+    def test_sheriff_stats_match_columns_for_long_games(self):
+        """Test running totals agree with the columns over many events."""
+        gms = GameMasterState()
+
+        for i in range(10_000):
+            gms.record_event(
+                "merchant",
+                "apple",
+                2,
+                ["apple"] * 2,
+                was_opened=i % 3 == 0,
+                caught_lie=i % 6 == 0,
+                bribe_offered=i % 5,
+                bribe_accepted=i % 10 == 1,
+            )
+
+        stats = gms.get_sheriff_stats()
+        self.assertEqual(stats["total_inspections"], sum(gms.was_opened))
+        self.assertEqual(stats["total_catches"], sum(gms.caught_lie))
+        self.assertEqual(stats["bribes_offered"], sum(b > 0 for b in gms.bribe_offered))
+        self.assertEqual(stats["bribes_accepted"], sum(gms.bribe_accepted))
+
+    def test_window_stats_cover_recent_events(self):
+        """Test windowed stats only count the most recent events."""
+        gms = GameMasterState()
+
+        for i in range(25):
+            gms.record_event(
+                f"merchant_{i}", "apple", 3, ["apple"] * 3, i >= 20, False, i % 2
+            )
+
+        window = gms.get_window_stats(10)
+        self.assertEqual(window["events"], 10)
+        self.assertEqual(window["inspections"], 5)
+        self.assertEqual(window["bribes_offered"], 5)
+
+        self.assertEqual(gms.get_window_stats(100)["events"], 20)
+
+    def test_history_view_matches_dict_history(self):
+        """Test the column view exposes the same events as the dict history."""
+        gms = GameMasterState()
+
+        for i in range(6):
+            gms.record_event(
+                f"merchant_{i}", "apple", 2, ["apple"] * 2, i % 2 == 0, False, i
+            )
+
+        view = gms.get_history_for_tier(MerchantTier.MEDIUM, as_dicts=False)
+        dicts = gms.get_history_for_tier(MerchantTier.MEDIUM)
+
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), dicts)
+        self.assertEqual(view.opened, [True, False, True, False])
+        self.assertEqual(view.bribe_offered, [2, 3, 4, 5])
+        self.assertEqual(view[-1], dicts[-1])
+        self.assertEqual(view[-2:].bribe_offered, [4, 5])
+
+    def test_history_view_rows_match_columns(self):
+        """Test view rows agree whether read from the ring buffer or columns."""
+        gms = GameMasterState()
+
+        for i in range(30):
+            gms.record_event(
+                "merchant", "apple", 4, ["apple"] * 4, i % 2 == 0, False, i % 3
+            )
+
+        self.assertEqual(len(gms.recent_events), 20)
+        view = gms.get_history_for_tier(MerchantTier.HARD, as_dicts=False)
+        for window in (view[-10:], view[-20:], view[-25:], view[3:12]):
+            expected = list(
+                zip(
+                    window.opened,
+                    window.caught,
+                    window.bribe_offered,
+                    window.bribe_ratio,
+                    window.bribe_accepted,
+                    strict=True,
+                )
+            )
+            self.assertEqual(window.rows(), expected)
+
+    def test_bribe_ratio_recorded_per_event(self):
+        """Test each event stores its bribe as a ratio of the declared value."""
+        gms = GameMasterState()
+
+        gms.record_event("merchant_a", "apple", 4, ["apple"] * 4, False, False, 4)
+        gms.record_event("merchant_b", "cheese", 2, ["cheese"] * 2, False, False)
+        gms.record_event("merchant_c", "apple", 0, [], False, False, 3)
+
+        self.assertEqual(gms.declared_values, [8, 6, 0])
+        self.assertEqual(gms.bribe_ratios, [0.5, 0.0, 0.0])
+        self.assertEqual(gms.events[0].declared_value, 8)
+        view = gms.get_history_for_tier(MerchantTier.HARD, as_dicts=False)
+        self.assertEqual(view.bribe_ratio, [0.5, 0.0, 0.0])
+
 
 class TestGameStats(unittest.TestCase):
     """Test game statistics tracking."""
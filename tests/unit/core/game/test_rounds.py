@@ -201,8 +201,7 @@ class TestContrabandTracking(unittest.TestCase):
         """Test that merchant.record_round_result is called when contraband slips through."""
         sheriff = create_test_sheriff(perception=1)
         merchant = Mock(spec=Merchant)
-        merchant.roll_bluff = Mock(return_value=20)
-        merchant.record_round_result = Mock()
+        merchant.roll_bluff.return_value = 20
 
         decl = Declaration(good_id="apple", count=1)
         actual = [SILK]
@@ -218,10 +217,8 @@ class TestContrabandTracking(unittest.TestCase):
         """Test that exceptions from merchant.record_round_result are handled gracefully."""
         sheriff = create_test_sheriff(perception=1)
         merchant = Mock(spec=Merchant)
-        merchant.roll_bluff = Mock(return_value=20)
-        merchant.record_round_result = Mock(
-            side_effect=AttributeError("Not implemented")
-        )
+        merchant.roll_bluff.return_value = 20
+        merchant.record_round_result.side_effect = AttributeError("Not implemented")
 
         decl = Declaration(good_id="apple", count=1)
         actual = [SILK]
@@ -15,6 +15,7 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 
 from core.mechanics.bag_builder import build_bag_and_declaration, choose_tell
+from core.players.merchants import Merchant
 
 
 class TestBuildBagAndDeclaration:
@@ -197,3 +198,24 @@ class TestChooseTell:
 
         # All should be from honest list
         assert all(tell in mock_merchant.tells_honest for tell in tells)
+
+    def test_choose_tell_for_merchant_uses_prefetched_picks(self):
+        """Test real merchants draw tells from a prefetched batch"""
+        merchant = Merchant(
+            id="tess",
+            name="Tess",
+            intro="",
+            tells_honest=["calm", "steady"],
+            tells_lying=["sweats"],
+        )
+
+        tells = [choose_tell(merchant, is_honest=True) for _ in range(40)]
+
+        assert set(tells) <= {"calm", "steady"}
+        assert choose_tell(merchant, is_honest=False) == "sweats"
+
+        merchant.tells_honest = ["new tell"]
+        assert choose_tell(merchant, is_honest=True) == "new tell"
+
+        merchant.tells_lying = []
+        assert choose_tell(merchant, is_honest=False) == ""
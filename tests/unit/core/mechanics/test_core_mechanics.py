@@ -152,14 +152,14 @@ class TestRoundState(unittest.TestCase):
 
         rs = create_test_round_state(merchant=merchant, bag_actual=bag)
         rs.sheriff_opens = True
-        rs.contraband_found_count = 1
-        rs.contraband_found_value = SILK.value
+        rs.sheriff_caught_lie = True
 
         self.assertTrue(rs.sheriff_opens)
-        self.assertEqual(rs.contraband_found_count, 1)
-        self.assertEqual(
-            rs.contraband_found_value, SILK.value
-        )  # Dynamic: use actual SILK value
+        self.assertTrue(rs.sheriff_caught_lie)
+        self.assertEqual(rs.bag_actual, [APPLE, SILK])
+        # RoundState is slotted, so only declared fields can be set
+        with self.assertRaises(AttributeError):
+            rs.contraband_found_count = 1
 
 
 class TestMerchant(unittest.TestCase):
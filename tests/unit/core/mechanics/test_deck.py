@@ -4,6 +4,8 @@ Tests for Deck System
 Tests the weighted probability deck system for drawing merchant hands.
 """
 
+import random
+
 import pytest
 
 from core.mechanics.deck import (
@@ -104,6 +106,15 @@ class TestDrawHand:
             assert hasattr(card, "value"), "Card should have value"
             assert hasattr(card, "is_legal"), "Card should have is_legal method"
 
+    def test_draw_hand_matches_weighted_choices(self):
+        """Test draw_hand makes the same weighted draw as random.choices."""
+        hand = draw_hand(6, rng=random.Random(42))
+        expected_ids = random.Random(42).choices(
+            list(CARD_WEIGHTS), weights=list(CARD_WEIGHTS.values()), k=6
+        )
+
+        assert [card.id for card in hand] == expected_ids
+
     def test_draw_hand_distribution(self):
         """Test that hand distribution roughly matches probabilities over many draws."""
         # Draw 1000 hands and count card types
@@ -1,4 +1,10 @@
-from core.mechanics.goods import APPLE, SILK, good_by_id
+from core.mechanics.goods import (
+    ALL_GOODS,
+    APPLE,
+    CONTRABAND_IDS,
+    SILK,
+    good_by_id,
+)
 
 
 def test_good_properties():
@@ -11,3 +17,8 @@ def test_good_by_id_lookup():
     g = good_by_id("bread")
     assert g is not None
     assert g.name == "Bread"
+
+
+def test_contraband_ids_match_goods():
+    contraband_ids = {g.id for g in ALL_GOODS if g.is_contraband()}
+    assert contraband_ids == CONTRABAND_IDS
@@ -3,15 +3,9 @@ Test the negotiation system with different merchant personalities.
 
 Run from project root:
 
-    python tests/test_negotiation.py
+    python -m pytest tests/unit/core/mechanics/test_negotiation.py
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.mechanics.goods import PEPPER, SILK
 from core.mechanics.negotiation import (
     initiate_threat,
@@ -5,8 +5,9 @@ Removes redundant tests that test the same code paths with different data.
 """
 
 import json
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, patch
 
 from core.players.merchant_loader import characters_dir, load_merchants
 
@@ -66,7 +67,7 @@ class TestLoadMerchantsBasicLoading:
 
     @patch("core.players.merchant_loader.log_debug")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_load_single_merchant(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_debug
@@ -116,7 +117,7 @@ class TestLoadMerchantsLimitAndRandomization:
     @patch("random.sample")
     @patch("core.players.merchant_loader.log_debug")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_load_merchants_with_limit(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_debug, mock_sample
@@ -146,7 +147,7 @@ class TestLoadMerchantsLimitAndRandomization:
     @patch("random.shuffle")
     @patch("core.players.merchant_loader.log_debug")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_load_merchants_without_limit_shuffles(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_debug, mock_shuffle
@@ -178,7 +179,7 @@ class TestLoadMerchantsErrorHandling:
 
     @patch("core.players.merchant_loader.log_warning")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_load_merchant_missing_required_field(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_warning
@@ -209,7 +210,7 @@ class TestLoadMerchantsErrorHandling:
 
     @patch("core.players.merchant_loader.log_error")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_load_merchant_invalid_json(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_error
@@ -240,7 +241,7 @@ class TestLoadMerchantsMultipleFiles:
 
     @patch("core.players.merchant_loader.log_debug")
     @patch("core.players.merchant_loader.log_info")
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open", return_value=nullcontext())
     @patch("core.players.merchant_loader.characters_dir")
     def test_load_multiple_merchants(
         self, mock_chars_dir, mock_file, mock_log_info, mock_log_debug
@@ -271,3 +272,35 @@ class TestLoadMerchantsMultipleFiles:
         assert result[0].name == "Alice"
         assert result[1].name == "Bob"
         assert result[2].name == "Charlie"
+
+    @patch("core.players.merchant_loader.characters_dir")
+    def test_repeated_loads_parse_each_file_once(self, mock_chars_dir, tmp_path):
+        """Test reloading reuses parsed JSON but builds fresh merchants"""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "alice.json").write_text(json.dumps({"name": "Alice"}))
+        mock_chars_dir.return_value = tmp_path
+
+        with patch("json.load", wraps=json.load) as mock_load:
+            first = load_merchants()
+            second = load_merchants()
+
+        assert mock_load.call_count == 1
+        assert [m.name for m in second] == ["Alice"]
+        assert first[0] is not second[0]
+
+    @patch("core.players.merchant_loader.characters_dir")
+    def test_repeated_loads_do_not_share_tells(self, mock_chars_dir, tmp_path):
+        """Test merchants from the cached JSON get their own tell lists"""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "alice.json").write_text(
+            json.dumps({"name": "Alice", "tells_honest": ["calm"]})
+        )
+        mock_chars_dir.return_value = tmp_path
+
+        first = load_merchants()
+        first[0].tells_honest.append("smiles")
+        second = load_merchants()
+
+        assert second[0].tells_honest == ["calm"]
@@ -3,17 +3,28 @@ Unit tests for Monte Carlo Sheriff.
 Tests probabilistic decision-making and expected value calculations.
 """
 
+import random
 from unittest.mock import patch
 
 import pytest
 
-from core.mechanics.goods import APPLE
+from core.mechanics.goods import APPLE, SILK
 from core.players.monte_carlo_sheriff import (
     MonteCarloSheriff,
+    _learn_distributions,
+    _simulate_draws,
     create_monte_carlo_sheriff,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_distribution_cache():
+    """Start every test without distributions learned by earlier tests."""
+    _learn_distributions.cache_clear()
+    yield
+    _learn_distributions.cache_clear()
+
+
 class TestMonteCarloSheriffInitialization:
     """Test sheriff initialization and simulation."""
 
@@ -48,6 +59,53 @@ class TestMonteCarloSheriffInitialization:
         # Should have called draw_hand for each simulation (10 honest + 10 smuggle = 20)
         assert mock_draw_hand.call_count == 20
 
+    @patch("core.players.monte_carlo_sheriff.redraw_cards")
+    @patch("core.players.monte_carlo_sheriff.draw_hand")
+    def test_honest_simulation_redraws_contraband(
+        self, mock_draw_hand, mock_redraw_cards
+    ):
+        """Test honest simulations redraw only the contraband in the hand."""
+        hand = [APPLE, APPLE, APPLE, APPLE, SILK, SILK]
+        mock_draw_hand.return_value = hand
+        mock_redraw_cards.return_value = hand
+        rng = random.Random(0)
+
+        _simulate_draws(strategy="honest", n=1, rng=rng)
+
+        mock_redraw_cards.assert_called_once_with(hand, 2, prefer_legal=True, rng=rng)
+
+    def test_same_seed_learns_same_distributions(self):
+        """Test seeded simulations are reproducible."""
+        first = MonteCarloSheriff(simulation_count=30, rng_seed=7)
+        second = MonteCarloSheriff(simulation_count=30, rng_seed=7)
+
+        assert first.honest_distribution == second.honest_distribution
+        assert first.smuggler_distribution == second.smuggler_distribution
+
+    @patch("core.players.monte_carlo_sheriff.draw_hand")
+    def test_reuses_cached_distributions(self, mock_draw_hand):
+        """Test sheriffs with identical simulation inputs share learned results."""
+        mock_draw_hand.return_value = [APPLE, APPLE, APPLE, APPLE, APPLE, APPLE]
+
+        first = MonteCarloSheriff(simulation_count=10)
+        second = MonteCarloSheriff(simulation_count=10)
+        MonteCarloSheriff(simulation_count=10, rng_seed=1)
+
+        # Only the first sheriff and the differently seeded one simulate
+        assert mock_draw_hand.call_count == 40
+        assert second.honest_distribution == first.honest_distribution
+        assert second.honest_distribution is not first.honest_distribution
+
+    def test_cached_distributions_are_immutable(self):
+        """Test the shared cache hands out read-only tables."""
+        honest, smuggler = _learn_distributions(10, 0)
+
+        assert isinstance(honest, tuple)
+        assert isinstance(smuggler, tuple)
+        assert (
+            dict(honest) == MonteCarloSheriff(simulation_count=10).honest_distribution
+        )
+
     def test_builds_probability_distributions(self):
         """Test builds probability distributions from simulations."""
         sheriff = MonteCarloSheriff(simulation_count=20)
@@ -193,6 +251,74 @@ class TestMerchantHonestyRate:
         assert rate == 1.0
 
 
+class TestHonestyCache:
+    """Test incremental per-merchant honesty tracking."""
+
+    def test_record_encounter_updates_rate(self):
+        """Test recorded encounters keep the tracked history's counts current."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        history = [{"opened": True, "caught": False}]
+        sheriff._get_merchant_honesty_rate(history, "Alice")
+
+        entry = {"opened": True, "caught": True}
+        history.append(entry)
+        sheriff.record_encounter("Alice", entry)
+        with patch.object(sheriff, "_count_honest") as mock_count:
+            rate = sheriff._get_merchant_honesty_rate(history, "Alice")
+
+        assert rate == 0.5
+        mock_count.assert_not_called()
+
+    def test_no_history_uses_default_prior(self):
+        """Test a missing history gives 0.5 even when the merchant is cached."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        sheriff._get_merchant_honesty_rate([{"opened": True, "caught": True}], "Alice")
+
+        assert sheriff._get_merchant_honesty_rate(None, "Alice") == 0.5
+        assert sheriff._get_merchant_honesty_rate(merchant_name="Bob") == 0.5
+
+    def test_only_new_history_entries_are_scanned(self):
+        """Test a growing history is folded in incrementally."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        history = [{"opened": True, "caught": True}]
+
+        assert sheriff._get_merchant_honesty_rate(history, "Alice") == 0.0
+
+        history.append({"opened": False})
+        with patch.object(
+            sheriff, "_count_honest", wraps=sheriff._count_honest
+        ) as mock_count:
+            rate = sheriff._get_merchant_honesty_rate(history, "Alice")
+
+        assert rate == 0.5
+        mock_count.assert_called_once_with(history[1:])
+
+    def test_rebuilds_when_history_shrinks(self):
+        """Test a replaced, shorter history rebuilds the cached counts."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        sheriff._get_merchant_honesty_rate(
+            [{"opened": True, "caught": True}] * 3, "Alice"
+        )
+
+        rate = sheriff._get_merchant_honesty_rate([{"opened": False}], "Alice")
+
+        assert rate == 1.0
+
+    def test_same_length_history_is_not_reused(self):
+        """Test a different history of the same length is rescanned."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        liar_history = [{"opened": True, "caught": True}] * 4
+        honest_history = [{"opened": True, "caught": False}] * 4
+
+        assert sheriff._get_merchant_honesty_rate(liar_history, "Alice") == 0.0
+        assert sheriff._get_merchant_honesty_rate(honest_history, "Alice") == 1.0
+
+        reasoning = sheriff.get_inspection_reasoning(
+            "Alice", {"good_id": "apple", "count": 4}, 0, honest_history
+        )
+        assert "P(Honest): 100.0%" in reasoning
+
+
 class TestInspectionDecision:
     """Test inspection decision logic."""
 
@@ -280,6 +406,82 @@ class TestInspectionDecision:
         assert aggressive_inspects or not cautious_inspects
 
 
+class TestDecisionTable:
+    """Test the decision path and its precomputed likelihood table."""
+
+    def test_reuses_likelihood_table(self):
+        """Test repeated decisions reuse the table built for the distributions."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        sheriff.honest_distribution = {("silk", 6): 0.01}
+        sheriff.smuggler_distribution = {("silk", 6): 0.5}
+
+        declaration = {"good_id": "silk", "count": 6}
+        sheriff.should_inspect("TestMerchant", declaration, 0, None)
+        table = sheriff._log_likelihood_ratio
+
+        assert sheriff.should_inspect("TestMerchant", declaration, 0, None) is True
+        assert sheriff._log_likelihood_ratio is table
+
+    def test_prior_is_computed_once_per_decision(self):
+        """Test a decision scans the merchant's history only once."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        history = [{"opened": True, "caught": True}, {"opened": False}]
+
+        with patch.object(
+            sheriff,
+            "_get_merchant_honesty_rate",
+            wraps=sheriff._get_merchant_honesty_rate,
+        ) as mock_rate:
+            sheriff.should_inspect(
+                "TestMerchant", {"good_id": "apple", "count": 4}, 0, history
+            )
+
+        mock_rate.assert_called_once()
+
+    def test_table_resets_when_distributions_change(self):
+        """Test replacing the distributions rebuilds the likelihood table."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        sheriff.honest_distribution = {("silk", 6): 0.01}
+        sheriff.smuggler_distribution = {("silk", 6): 0.5}
+
+        declaration = {"good_id": "silk", "count": 6}
+        assert sheriff.should_inspect("TestMerchant", declaration, 0, None) is True
+
+        sheriff.honest_distribution = {("silk", 6): 0.5}
+        sheriff.smuggler_distribution = {("silk", 6): 0.01}
+
+        assert sheriff.should_inspect("TestMerchant", declaration, 0, None) is False
+
+    def test_batch_matches_individual_decisions(self):
+        """Test batched decisions agree with one-at-a-time decisions."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        sheriff.honest_distribution = {("silk", 6): 0.01, ("apple", 4): 0.4}
+        sheriff.smuggler_distribution = {("silk", 6): 0.5, ("apple", 4): 0.05}
+
+        names = ["Alice", "Bob", "Cedric"]
+        declarations = [
+            {"good_id": "silk", "count": 6},
+            {"good_id": "apple", "count": 4},
+            {"good_id": "apple", "count": 4},
+        ]
+        bribes = [0, 5, 0]
+
+        batch = sheriff.batch_should_inspect(names, declarations, bribes)
+
+        assert batch == [
+            sheriff.should_inspect(name, decl, bribe, None)
+            for name, decl, bribe in zip(names, declarations, bribes, strict=True)
+        ]
+
+    def test_batch_rejects_mismatched_inputs(self):
+        """Test a batch whose input lists differ in length fails loudly."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+        declarations = [{"good_id": "apple", "count": 4}]
+
+        with pytest.raises(ValueError):
+            sheriff.batch_should_inspect(["Alice", "Bob"], declarations, [0, 0])
+
+
 class TestExpectedValueCalculation:
     """Test expected value calculations."""
 
@@ -384,6 +586,23 @@ class TestInspectionReasoning:
         assert "EV(Accept)" in reasoning
         assert "Decision" in reasoning
 
+    def test_reasoning_computes_decision_once(self):
+        """Test reasoning reuses one decision computation for all its figures."""
+        sheriff = MonteCarloSheriff(simulation_count=10)
+
+        declaration = {"good_id": "apple", "count": 4}
+
+        with patch.object(
+            sheriff, "_posterior_honesty", return_value=0.9
+        ) as mock_probability:
+            reasoning = sheriff.get_inspection_reasoning(
+                "TestMerchant", declaration, bribe_offered=5, merchant_history=None
+            )
+
+        mock_probability.assert_called_once()
+        assert "P(Honest): 90.0%" in reasoning
+        assert "Decision: LET PASS" in reasoning
+
 
 class TestFactoryFunction:
     """Test factory function."""
@@ -8,6 +8,7 @@ to determine optimal bribe ratios.
 import pytest
 
 from core.players.silas_voss import SilasVoss
+from core.systems.game_master_state import GameMasterState
 
 
 class TestSilasBribeLearning:
@@ -129,6 +130,23 @@ class TestSilasBribeLearning:
         # Should only use last 20 rounds (all at 50%)
         assert result == 0.5, f"Should only use last 20 rounds, got {result}"
 
+    def test_learn_bribe_ratio_from_history_view(self):
+        """Test learning from recorded columns matches the dict history."""
+        silas = SilasVoss("silas", "Silas", "Test", [], [], 8, 6, 7, 5)
+
+        state = GameMasterState()
+        for i in range(12):
+            # apple is worth 2, so 10 apples declare 20 gold
+            state.record_event(
+                "m", "apple", 10, ["apple"] * 10, False, False, 4 + i, i % 3 != 0
+            )
+
+        view = state.get_history_for_tier(None, as_dicts=False)
+        expected = silas._average_successful_bribe_ratio(list(view))
+        assert silas._average_successful_bribe_ratio(view) == expected
+        # Last five accepted bribes were 9, 11, 12, 14 and 15 gold
+        assert expected == pytest.approx((9 + 11 + 12 + 14 + 15) / 5 / 20)
+
 
 class TestSilasProactiveBribeWithLearning:
     """Test bribe calculation that uses learning."""
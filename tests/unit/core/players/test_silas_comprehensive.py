@@ -310,6 +310,17 @@ class TestGetBribeRatio:
         ratio = silas._get_bribe_ratio(history_entry)
         assert ratio == 1.0
 
+    def test_bribe_ratio_uses_recorded_declared_value(self, silas):
+        """Test a recorded declared_value is used without a good lookup."""
+        history_entry = {
+            "bribe_offered": 3,
+            "declaration": {"good_id": "unknown", "count": 5},
+            "declared_value": 12,
+        }
+
+        ratio = silas._get_bribe_ratio(history_entry)
+        assert ratio == 0.25
+
     def test_bribe_ratio_zero_when_no_bribe(self, silas):
         """Test returns 0 when no bribe offered."""
         history_entry = {
@@ -2,10 +2,13 @@
 Simple tests for Silas Voss's core functionality.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from core.mechanics.goods import SILK
 from core.players.silas_voss import SilasVoss
+from core.systems.game_master_state import GameMasterState
 
 
 class TestSilasBasics:
@@ -120,6 +123,96 @@ class TestSilasBasics:
         result = silas._detect_sheriff_type(history)
         assert result == "corrupt"
 
+    def test_detect_sheriff_type_cached_per_history(self):
+        """Test repeat detection on an unchanged history skips the rescan."""
+        silas = SilasVoss(
+            id="silas",
+            name="Silas",
+            intro="Test",
+            tells_honest=[],
+            tells_lying=[],
+            bluff_skill=8,
+            risk_tolerance=6,
+            greed=7,
+            honesty_bias=5,
+        )
+
+        history = [{"opened": True, "bribe_offered": 0}] * 10
+        assert silas._detect_sheriff_type(history) == "strict"
+
+        with patch.object(silas, "_classify_sheriff_type") as mock_classify:
+            assert silas._detect_sheriff_type(history) == "strict"
+        mock_classify.assert_not_called()
+
+        # Growing the history invalidates the cached result
+        history = history + [{"opened": False, "bribe_offered": 0}] * 10
+        assert silas._detect_sheriff_type(history) == "unknown"
+
+    def test_detect_sheriff_type_from_history_view(self):
+        """Test detection reads columns from a HistoryView like a dict list."""
+        silas = SilasVoss(
+            id="silas",
+            name="Silas",
+            intro="Test",
+            tells_honest=[],
+            tells_lying=[],
+            bluff_skill=8,
+            risk_tolerance=6,
+            greed=7,
+            honesty_bias=5,
+        )
+
+        state = GameMasterState()
+        for i in range(10):
+            state.record_event("m", "apple", 4, ["silk"], False, False, 5, i < 9)
+
+        view = state.get_history_for_tier(None, as_dicts=False)
+        assert silas._classify_sheriff_type(view) == "corrupt"
+        assert silas._classify_sheriff_type(list(view)) == "corrupt"
+
+    def test_turn_classifies_sheriff_once(self):
+        """Test declaration and bribe decisions in one turn share one scan."""
+        silas = SilasVoss(
+            id="silas", name="Silas", intro="Test", tells_honest=[], tells_lying=[]
+        )
+        silas.hand = [SILK] * 6
+
+        state = GameMasterState()
+        for i in range(10):
+            state.record_event("m", "apple", 4, ["silk"], False, False, 5, i < 9)
+
+        classify = silas._classify_sheriff_type
+        with patch(
+            "core.systems.game_master_state.get_game_master_state",
+            return_value=state,
+        ):
+            with patch.object(
+                silas, "_classify_sheriff_type", wraps=classify
+            ) as mock_classify:
+                silas.choose_declaration()
+                silas.should_offer_proactive_bribe(5, 5, [SILK], [SILK])
+                silas.calculate_proactive_bribe([SILK], True, 5, [SILK])
+
+        assert mock_classify.call_count == 1
+
+    def test_random_choices_use_own_rng(self):
+        """Test each Silas draws from his own seeded RNG."""
+        kwargs = {
+            "id": "silas",
+            "name": "Silas",
+            "intro": "Test",
+            "tells_honest": [],
+            "tells_lying": [],
+        }
+        first, second = SilasVoss(**kwargs), SilasVoss(**kwargs)
+        assert first._rng is not second._rng
+
+        first._rng.seed(7)
+        second._rng.seed(7)
+        assert [first._should_play_honest([]) for _ in range(20)] == [
+            second._should_play_honest([]) for _ in range(20)
+        ]
+
     def test_get_bribe_ratio(self):
         """Test bribe ratio calculation."""
         silas = SilasVoss(
@@ -148,6 +148,23 @@ class TestAccuracyCalculation(unittest.TestCase):
 
         self.assertEqual(accuracy, 0.0)
 
+    def test_accuracy_from_constructor_counts(self):
+        """Test accuracy is computed for stats built with existing counts."""
+        stats = GameStats(
+            total_inspections=3, correct_inspections=2, missed_smugglers=1
+        )
+
+        self.assertEqual(stats.accuracy_percentage(), 50.0)
+
+    def test_accuracy_follows_direct_counter_updates(self):
+        """Test accuracy reflects counters assigned outside the record_* methods."""
+        stats = GameStats()
+        stats.record_inspection(was_honest=False, caught_lie=True)
+
+        stats.total_inspections = 4
+
+        self.assertEqual(stats.accuracy_percentage(), 25.0)
+
 
 class TestComplexScenarios(unittest.TestCase):
     """Test complex game scenarios."""
@@ -3,21 +3,33 @@ Tests for the game logging system.
 """
 
 import logging
-from pathlib import Path
+import logging.handlers
 from unittest.mock import patch
 
 import pytest
 
+from core.systems import logger as logger_module
 from core.systems.logger import (
+    BufferedFileHandler,
+    attach_queued_handlers,
     game_logger,
     log_debug,
     log_error,
     log_info,
     log_warning,
     setup_logger,
+    stop_queued_handlers,
 )
 
 
+@pytest.fixture(autouse=True)
+def logs_dir(tmp_path, monkeypatch):
+    """Point setup_logger at a temporary logs directory, not core/logs."""
+    log_dir = tmp_path / "logs"
+    monkeypatch.setattr(logger_module, "_LOGS_DIR", log_dir)
+    return log_dir
+
+
 class TestSetupLogger:
     """Test logger setup and configuration."""
 
@@ -38,19 +50,22 @@ class TestSetupLogger:
 
         assert logger1 is logger2
 
-    def test_setup_logger_creates_log_directory(self):
+    def test_setup_logger_creates_log_directory(self, logs_dir):
         """Test that setup_logger creates logs directory."""
-        from core.systems.logger import setup_logger
-
         setup_logger("test_dir")
 
-        # Logger creates logs directory at core/logs (relative to logger.py location)
-        # Test file is at: tests/unit/core/systems/test_logger.py
-        # Need to go up 4 levels to get to project root, then into core/logs
-        test_file_path = Path(__file__).resolve()
-        project_root = test_file_path.parent.parent.parent.parent.parent
-        log_dir = project_root / "core" / "logs"
-        assert log_dir.exists(), f"Logs directory should be created at {log_dir}"
+        assert logs_dir.exists(), f"Logs directory should be created at {logs_dir}"
+
+    def test_setup_logger_configures_default_logger(self):
+        """Test the default name gets a real file handler, not a no-op."""
+        logger = setup_logger()
+        try:
+            assert logger is game_logger
+            assert logger.level == logging.DEBUG
+            assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        finally:
+            stop_queued_handlers(logger)
+            logger.setLevel(logging.NOTSET)
 
     def test_setup_logger_sets_debug_level(self):
         """Test that logger is set to DEBUG level."""
@@ -62,16 +77,114 @@ class TestSetupLogger:
         """Test that logger has a file handler configured."""
         logger = setup_logger("test_handler")
 
-        # Should have at least one handler (file handler)
+        # Should have at least one handler (queue handler)
         assert len(logger.handlers) > 0
 
-        # Check that at least one handler is a FileHandler
+        # Check that at least one FileHandler sits behind the queue listener
         has_file_handler = any(
-            isinstance(h, logging.FileHandler) for h in logger.handlers
+            isinstance(target, logging.FileHandler)
+            for h in logger.handlers
+            for target in h.listener.handlers
         )
         assert has_file_handler, "Logger should have a FileHandler"
 
 
+class _RecordingHandler(logging.Handler):
+    """Handler that keeps the messages it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestQueuedHandlers:
+    """Test routing records through a background queue listener."""
+
+    def test_records_reach_handlers_through_queue(self):
+        """Test queued records are delivered once the listener drains."""
+        logger = logging.getLogger("test_queued")
+        logger.setLevel(logging.INFO)
+        target = _RecordingHandler()
+
+        listener = attach_queued_handlers(logger, target)
+        try:
+            assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+            logger.info("queued %s", "message")
+        finally:
+            stop_queued_handlers(logger)
+
+        assert target.messages == ["queued message"]
+        assert logger.handlers == []
+        assert listener._thread is None
+
+
+class TestBufferedFileHandler:
+    """Test batched writes to log files."""
+
+    def test_buffers_until_error_or_close(self, tmp_path):
+        """Test INFO records stay buffered until an ERROR forces a flush."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(log_file, encoding="utf-8", flush_interval=60)
+        logger = logging.getLogger("test_buffered")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            logger.info("first")
+            assert log_file.read_text(encoding="utf-8") == ""
+
+            logger.error("second")
+            assert log_file.read_text(encoding="utf-8") == "first\nsecond\n"
+
+            logger.info("third")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        assert log_file.read_text(encoding="utf-8").endswith("third\n")
+
+    def test_close_flushes_and_leaves_no_timer(self, tmp_path):
+        """Test close writes buffered lines and never re-arms the flush timer."""
+        log_file = tmp_path / "closing.log"
+        handler = BufferedFileHandler(log_file, encoding="utf-8", flush_interval=60)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(logging.makeLogRecord({"msg": "pending", "levelno": logging.INFO}))
+        assert handler._flush_timer is not None
+
+        handler.close()
+        handler.flush()
+
+        assert handler._flush_timer is None
+        assert log_file.read_text(encoding="utf-8") == "pending\n"
+
+    def test_rotates_at_max_bytes(self, tmp_path):
+        """Test the file rolls over into numbered backups once it is full."""
+        log_file = tmp_path / "rotating.log"
+        handler = BufferedFileHandler(
+            log_file, encoding="utf-8", delay=True, max_bytes=32, backup_count=2
+        )
+        logger = logging.getLogger("test_rotating")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            assert not log_file.exists()
+            for i in range(8):
+                logger.info("line %d of the log", i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "rotating.log",
+            "rotating.log.1",
+            "rotating.log.2",
+        ]
+        assert log_file.read_text(encoding="utf-8") == "line 7 of the log\n"
+
+
 class TestLogFunctions:
     """Test logging convenience functions."""
 
@@ -96,6 +209,17 @@ class TestLogFunctions:
             assert "ValueError" in call_args[0][0]
             assert call_args[1].get("exc_info")
 
+    def test_log_error_without_traceback(self):
+        """Test logging an exception summary without its traceback."""
+        test_exception = ValueError("Test exception")
+
+        with patch.object(game_logger, "error") as mock_error:
+            log_error("Test error", test_exception, with_traceback=False)
+
+            mock_error.assert_called_once_with(
+                "Test error: ValueError: Test exception", exc_info=False
+            )
+
     def test_log_warning(self):
         """Test logging warning."""
         with patch.object(game_logger, "warning") as mock_warning:
@@ -121,6 +245,23 @@ class TestLogFunctions:
 class TestLoggerIntegration:
     """Integration tests for logger."""
 
+    def test_game_logger_propagates_to_root(self, caplog):
+        """Test game records reach the root handlers instead of their own file."""
+        assert not any(
+            isinstance(h, logging.handlers.QueueHandler) for h in game_logger.handlers
+        )
+
+        with caplog.at_level(logging.DEBUG):
+            log_info("Routed message")
+
+        assert [(r.name, r.getMessage()) for r in caplog.records] == [
+            ("sheriff_game", "Routed message")
+        ]
+
+    def test_game_logger_has_no_handlers_of_its_own(self):
+        """Test errors logged before setup still reach logging's last resort."""
+        assert game_logger.handlers == []
+
     def test_logger_writes_to_file(self):
         """Test that logger actually writes to log file."""
         # Create a test logger
@@ -0,0 +1,145 @@
+"""
+Tests for the error logging helpers.
+"""
+
+import logging
+import os
+from unittest.mock import MagicMock
+
+from core.utils import error_logger
+from core.utils.error_logger import (
+    CachedTimeFormatter,
+    cleanup_old_logs,
+    log_debug,
+    log_error,
+    log_game_event,
+)
+
+
+def _record(created: float) -> logging.LogRecord:
+    # msecs is derived from the real clock at creation, so pin it to created too
+    msecs = (created - int(created)) * 1000
+    return logging.makeLogRecord({"msg": "event", "created": created, "msecs": msecs})
+
+
+class TestCachedTimeFormatter:
+    """Test timestamp caching in the log formatter."""
+
+    def test_matches_standard_formatter(self):
+        """Test cached timestamps format exactly like logging.Formatter."""
+        cached = CachedTimeFormatter(
+            "%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S", cache_time=True
+        )
+        plain = logging.Formatter(
+            "%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+        for created in (1000.1, 1000.9, 1001.0, 5000.5):
+            assert cached.format(_record(created)) == plain.format(_record(created))
+
+    def test_reuses_timestamp_within_a_second(self):
+        """Test records in the same second share one formatted timestamp."""
+        formatter = CachedTimeFormatter(datefmt="%H:%M:%S", cache_time=True)
+
+        first = formatter.formatTime(_record(2000.2), formatter.datefmt)
+        second = formatter.formatTime(_record(2000.8), formatter.datefmt)
+
+        assert first is second
+
+    def test_shared_formatter_formats_record_once(self):
+        """Test a second handler formatting the same record reuses the text."""
+        formatter = CachedTimeFormatter("%(asctime)s %(message)s")
+        record = _record(4000.0)
+
+        first = formatter.format(record)
+        record.msg = "changed"
+
+        assert formatter.format(record) is first
+        assert formatter.format(_record(4000.0)) == first
+
+    def test_caching_is_opt_in(self):
+        """Test the default formatter leaves the cache unused."""
+        formatter = CachedTimeFormatter(datefmt="%H:%M:%S")
+
+        formatter.formatTime(_record(3000.0), formatter.datefmt)
+
+        assert formatter._cached_time == (None, "")
+
+
+class TestLogHelpers:
+    """Test the lazy-formatting log helpers."""
+
+    def test_log_game_event_formats_context(self, caplog):
+        """Test event context is joined onto the message."""
+        with caplog.at_level(logging.INFO):
+            log_game_event("bribe", "Offered", amount=5, merchant="Silas")
+
+        assert caplog.messages == ["[bribe] Offered | amount=5 | merchant=Silas"]
+
+    def test_log_debug_skips_context_when_disabled(self, caplog):
+        """Test suppressed debug calls never stringify their context."""
+        context = MagicMock()
+
+        with caplog.at_level(logging.INFO):
+            log_debug("ai", "Thinking", state=context)
+
+        context.__str__.assert_not_called()
+        assert caplog.messages == []
+
+    def test_log_error_includes_exception(self, caplog):
+        """Test errors carry the exception for the traceback."""
+        error = ValueError("bad")
+
+        with caplog.at_level(logging.ERROR):
+            log_error("merchant_load", "Failed", error)
+
+        assert caplog.messages == ["[merchant_load] Failed"]
+        assert caplog.records[0].exc_info[1] is error
+
+    def test_log_error_without_traceback(self, caplog):
+        """Test opting out of the traceback logs just the exception summary."""
+        with caplog.at_level(logging.ERROR):
+            log_error("portrait_load", "Missing", OSError("gone"), with_traceback=False)
+
+        assert caplog.messages == ["[portrait_load] Missing: OSError: gone"]
+        assert caplog.records[0].exc_info is None
+
+
+class TestCleanupOldLogs:
+    """Test pruning of old log files."""
+
+    def test_keeps_most_recent_logs(self, tmp_path, monkeypatch):
+        """Test only the newest log files survive and other files are untouched."""
+        monkeypatch.setattr(error_logger, "_LOGS_DIR", tmp_path)
+        for i in range(5):
+            log_file = tmp_path / f"game_{i}.log"
+            log_file.write_text("entry")
+            os.utime(log_file, (1000 + i, 1000 + i))
+        (tmp_path / "notes.txt").write_text("keep me")
+
+        cleanup_old_logs(keep_count=2)
+
+        remaining = sorted(p.name for p in tmp_path.iterdir())
+        assert remaining == ["game_3.log", "game_4.log", "notes.txt"]
+
+    def test_missing_directory_is_ignored(self, tmp_path, monkeypatch):
+        """Test cleanup is a no-op when no logs directory exists yet."""
+        monkeypatch.setattr(error_logger, "_LOGS_DIR", tmp_path / "missing")
+
+        cleanup_old_logs(keep_count=2)
+
+        assert not (tmp_path / "missing").exists()
+
+    def test_rotated_backups_count_as_logs(self, tmp_path, monkeypatch):
+        """Test rotated backups are pruned along with the active log files."""
+        monkeypatch.setattr(error_logger, "_LOGS_DIR", tmp_path)
+        names = ["game_1.log.2", "game_1.log.1", "game_1.log", "game_1.log.bak"]
+        for i, name in enumerate(names):
+            log_file = tmp_path / name
+            log_file.write_text("entry")
+            os.utime(log_file, (1000 + i, 1000 + i))
+
+        cleanup_old_logs(keep_count=1)
+
+        remaining = sorted(p.name for p in tmp_path.iterdir())
+        assert remaining == ["game_1.log", "game_1.log.bak"]
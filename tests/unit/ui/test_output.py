@@ -0,0 +1,93 @@
+"""
+Unit tests for ui/output.py
+Tests buffered game_print output and its flush points.
+"""
+
+# Must be first import - sets up test environment
+from unittest.mock import Mock, patch
+
+import tests.test_setup  # noqa: F401
+from ui import output
+from ui.output import flush_output, game_input, game_print, raw_print_scope
+
+
+class TestGamePrint:
+    """Tests for game_print buffering"""
+
+    def setup_method(self):
+        output._pending.clear()
+        output._pending_chars = 0
+
+    @patch("ui.pygame_ui.get_ui")
+    def test_prints_are_batched_until_flush(self, mock_get_ui):
+        """Test consecutive prints reach the UI as one display_text call"""
+        mock_ui = Mock()
+        mock_get_ui.return_value = mock_ui
+
+        game_print("First line")
+        game_print()
+        game_print("Second", "line")
+        mock_ui.display_text.assert_not_called()
+
+        flush_output()
+        mock_ui.display_text.assert_called_once_with(
+            "First line\nSecond line", clear_previous=False
+        )
+
+        flush_output()
+        mock_ui.display_text.assert_called_once()
+
+    @patch("ui.pygame_ui.get_ui")
+    def test_full_buffer_flushes(self, mock_get_ui):
+        """Test the buffer flushes itself once it reaches its size cap"""
+        mock_ui = Mock()
+        mock_get_ui.return_value = mock_ui
+
+        game_print("x" * output._MAX_PENDING_CHARS)
+
+        mock_ui.display_text.assert_called_once()
+        assert output._pending == []
+
+    @patch("ui.pygame_ui.get_ui")
+    def test_input_flushes_pending_text_and_prompt(self, mock_get_ui):
+        """Test game_input shows buffered text before waiting for input"""
+        mock_ui = Mock()
+        mock_ui.get_input.return_value = "inspect"
+        mock_get_ui.return_value = mock_ui
+
+        game_print("A merchant approaches.")
+        result = game_input("Your choice: ")
+
+        assert result == "inspect"
+        mock_ui.display_text.assert_called_once_with(
+            "A merchant approaches.\nYour choice: ", clear_previous=False
+        )
+
+
+class TestRawPrintScope:
+    """Tests for bypassing the UI with raw_print_scope"""
+
+    def setup_method(self):
+        output._pending.clear()
+        output._pending_chars = 0
+
+    def test_scope_sends_prints_to_real_print(self):
+        """Test prints inside the scope skip the buffer and reach print()"""
+        with patch.object(output, "_builtin_print") as mock_print:
+            with raw_print_scope():
+                game_print("Crash report", end="!\n")
+            game_print("Back in the UI")
+
+        mock_print.assert_called_once_with("Crash report", sep=" ", end="!\n")
+        assert output._pending == ["Back in the UI\n"]
+
+    def test_flush_inside_scope_sends_pending_text_to_real_print(self):
+        """Test buffered text is printed, not lost, when flushed in the scope"""
+        game_print("Unflushed line")
+
+        with patch.object(output, "_builtin_print") as mock_print:
+            with raw_print_scope():
+                flush_output()
+
+        mock_print.assert_called_once_with("Unflushed line\n", end="")
+        assert output._pending == []
@@ -11,12 +11,40 @@ Usage:
     name = game_input("What is your name? ")
 """
 
+import builtins
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+
+# The real built-ins, captured before main.py redirects them to this module
+_builtin_print = builtins.print
+_builtin_input = builtins.input
+
+# Per-thread switch that sends game_print() straight to the real print()
+_ctx = threading.local()
+
+
+@cache
+def _pygame_ui():
+    """Import ui.pygame_ui once; get_ui() is still looked up on the module."""
+    from ui import pygame_ui
+
+    return pygame_ui
+
+
+# Text printed during a turn is batched and sent to the UI in one display_text
+# call; anything that blocks on the player or redraws flushes it first.
+_MAX_PENDING_CHARS = 8192
+_pending: list[str] = []
+_pending_chars = 0
+
 
 def game_print(*args, sep: str = " ", end: str = "\n", **kwargs) -> None:
     """Display text in the game UI.
 
     This is a drop-in replacement for print() that works with the Pygame UI.
-    Falls back to standard print() if UI is not available.
+    Output is buffered until flush_output() runs or the buffer fills up.
 
     Args:
         *args: Values to print
@@ -24,18 +52,66 @@ def game_print(*args, sep: str = " ", end: str = "\n", **kwargs) -> None:
         end: String appended after the last value (default: '\n')
         **kwargs: Additional keyword arguments (for compatibility)
     """
+    global _pending_chars
+
+    if getattr(_ctx, "bypass", False):
+        _builtin_print(*args, sep=sep, end=end, **kwargs)
+        return
+
     text = sep.join(str(arg) for arg in args)
     if text or end != "\n":
         text += end
 
-    try:
-        from ui.pygame_ui import get_ui
+    _pending.append(text)
+    _pending_chars += len(text)
+    if _pending_chars >= _MAX_PENDING_CHARS:
+        flush_output()
+
+
+def flush_output() -> None:
+    """Send all buffered game_print() text to the UI in a single batch.
 
-        ui = get_ui()
-        ui.display_text(text.rstrip("\n"), clear_previous=False)
+    Inside raw_print_scope(), or if the UI is not available, the text goes to
+    standard print() instead.
+    """
+    global _pending_chars
+
+    if not _pending:
+        return
+    chunks = _pending[:]
+    _pending.clear()
+    _pending_chars = 0
+
+    if getattr(_ctx, "bypass", False):
+        _builtin_print("".join(chunks), end="")
+        return
+
+    # Blank prints never showed up as lines of their own, so drop them here
+    text = "\n".join(c.rstrip("\n") for c in chunks if c.strip())
+    if not text:
+        return
+
+    try:
+        ui = _pygame_ui().get_ui()
+        ui.display_text(text, clear_previous=False)
     except Exception:
         # Fallback to standard print if UI not available
-        print(text, end="")
+        _builtin_print("".join(chunks), end="")
+
+
+@contextmanager
+def raw_print_scope() -> Iterator[None]:
+    """Send print() output to the real stdout/stderr for the current thread.
+
+    Use around crash reporting and other non-UI output so it does not go
+    through the Pygame window.
+    """
+    previous = getattr(_ctx, "bypass", False)
+    _ctx.bypass = True
+    try:
+        yield
+    finally:
+        _ctx.bypass = previous
 
 
 def game_input(prompt: str = "") -> str:
@@ -52,17 +128,16 @@ def game_input(prompt: str = "") -> str:
     """
     if prompt:
         game_print(prompt, end="")
+    flush_output()
 
     try:
-        from ui.pygame_ui import get_ui
-
-        ui = get_ui()
+        ui = _pygame_ui().get_ui()
         return ui.get_input()
     except Exception:
         # Fallback to standard input if UI not available
-        return input()
+        return _builtin_input()
 
 
 # For backward compatibility with code that uses print/input directly
 # These can be imported and used explicitly instead of monkey patching
-__all__ = ["game_print", "game_input"]
+__all__ = ["game_print", "game_input", "flush_output", "raw_print_scope"]
@@ -4,6 +4,7 @@ Handles user input, choice buttons, and text entry
 """
 
 import sys
+from functools import lru_cache
 from typing import Optional
 
 import pygame
@@ -22,6 +23,32 @@ from ui.ui_constants import (
     WHITE,
 )
 
+# Choice button layout
+BUTTON_WIDTH = 220
+BUTTON_HEIGHT = 50
+BUTTON_SPACING = 20
+
+
+@lru_cache(maxsize=8)
+def _button_layout(count: int) -> tuple[pygame.Rect, ...]:
+    """Rects for a row of count buttons centered at the bottom of the screen.
+
+    The screen size is fixed, so each row length is laid out once. The
+    rects are shared between calls and must not be modified.
+    """
+    total_width = count * BUTTON_WIDTH + (count - 1) * BUTTON_SPACING
+    start_x = (SCREEN_WIDTH - total_width) // 2
+    start_y = SCREEN_HEIGHT - BUTTON_HEIGHT - 30
+    return tuple(
+        pygame.Rect(
+            start_x + i * (BUTTON_WIDTH + BUTTON_SPACING),
+            start_y,
+            BUTTON_WIDTH,
+            BUTTON_HEIGHT,
+        )
+        for i in range(count)
+    )
+
 
 class PygameInput:
     """Handles user input including text entry and choice buttons"""
@@ -97,21 +124,13 @@ class PygameInput:
         if prompt:
             self.text_display.display_text(prompt, clear_previous=False, animate=False)
 
-        # Create button rectangles - centered at bottom of screen
-        self.choice_buttons = []
-        button_width = 220
-        button_height = 50
-        button_spacing = 20
-
-        # Calculate total width needed
-        total_width = len(choices) * button_width + (len(choices) - 1) * button_spacing
-        start_x = (SCREEN_WIDTH - total_width) // 2
-        start_y = SCREEN_HEIGHT - button_height - 30
-
-        for i, (_key, display_text) in enumerate(choices):
-            x = start_x + i * (button_width + button_spacing)
-            rect = pygame.Rect(x, start_y, button_width, button_height)
-            self.choice_buttons.append((display_text, rect))
+        # Button rectangles - centered at bottom of screen
+        self.choice_buttons = [
+            (display_text, rect)
+            for (_key, display_text), rect in zip(
+                choices, _button_layout(len(choices)), strict=True
+            )
+        ]
 
         self._render_with_buttons()
 
@@ -121,6 +140,7 @@ class PygameInput:
 
         while selected is None:
             self.window.clock.tick(60)
+            mouse_moved = False
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -152,17 +172,21 @@ class PygameInput:
                             break
 
                 if event.type == pygame.MOUSEMOTION:
-                    # Only re-render if hover state changed
-                    mouse_pos = pygame.mouse.get_pos()
-                    current_hover = None
-                    for i, (_choice_text, rect) in enumerate(self.choice_buttons):
-                        if rect.collidepoint(mouse_pos):
-                            current_hover = i
-                            break
-
-                    if current_hover != last_hover_button:
-                        last_hover_button = current_hover
-                        self._render_with_buttons()
+                    # Hover is resolved once per frame, after the queue drains
+                    mouse_moved = True
+
+            if mouse_moved and selected is None:
+                # Only re-render if hover state changed
+                mouse_pos = pygame.mouse.get_pos()
+                current_hover = None
+                for i, (_choice_text, rect) in enumerate(self.choice_buttons):
+                    if rect.collidepoint(mouse_pos):
+                        current_hover = i
+                        break
+
+                if current_hover != last_hover_button:
+                    last_hover_button = current_hover
+                    self._render_with_buttons()
 
         # Clear buttons and show selected choice
         self.choice_buttons = []
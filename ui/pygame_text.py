@@ -86,11 +86,11 @@ class PygameText:
         current_line = []
 
         for word in words:
-            # Test if adding this word exceeds max width
+            # Test if adding this word exceeds max width; font.size measures
+            # the line without rasterizing a throwaway surface per word
             test_line = " ".join(current_line + [word])
-            test_surface = font.render(test_line, True, WHITE)
 
-            if test_surface.get_width() <= max_width:
+            if font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 # Start a new line
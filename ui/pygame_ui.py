@@ -5,6 +5,7 @@ Main interface that coordinates window, text, and input components
 
 from typing import Optional
 
+from ui.output import flush_output
 from ui.price_menu import PriceMenu
 from ui.pygame_input import PygameInput
 from ui.pygame_text import PygameText
@@ -50,10 +51,12 @@ class VisualNovelUI:
         self, text: str, clear_previous: bool = True, animate: bool = True
     ):
         """Display text with optional typewriter effect"""
+        flush_output()
         self.text.display_text(text, clear_previous, animate)
 
     def clear_text(self):
         """Clear all text"""
+        flush_output()
         self.text.clear_text()
 
     def update_stats(
@@ -75,14 +78,17 @@ class VisualNovelUI:
     # Input methods
     def get_input(self, prompt: str = "") -> str:
         """Get text input from user"""
+        flush_output()
         return self.input.get_input(prompt)
 
     def show_choices(self, prompt: str, choices: list[tuple[str, str]]) -> str:
         """Show choice buttons and return selected choice"""
+        flush_output()
         return self.input.show_choices(prompt, choices)
 
     def wait_for_continue(self):
         """Wait for user to continue"""
+        flush_output()
         self.input.wait_for_continue()
 
     # Event handling
@@ -3,6 +3,7 @@ Pygame Window Management
 Handles window initialization, rendering, and portrait display
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -72,8 +73,9 @@ class PygameWindow:
             if self.font_title is None:
                 self.font_title = self.font_large
 
-        # Current portrait
+        # Current portrait, plus every portrait decoded and scaled so far
         self.current_portrait: Optional[pygame.Surface] = None
+        self._portrait_cache: dict[str, pygame.Surface] = {}
         self.portrait_slide_offset: int = (
             PORTRAIT_INITIAL_OFFSET  # For slide-in effect (starts off-screen left)
         )
@@ -93,14 +95,18 @@ class PygameWindow:
         )
 
         try:
-            # Load and scale the portrait
-            portrait = pygame.image.load(str(portrait_path))
-            # Scale to fit portrait area while maintaining aspect ratio
-            portrait = pygame.transform.scale(
-                portrait, (PORTRAIT_WIDTH, PORTRAIT_HEIGHT)
-            )
-            # Convert to surface with alpha channel
-            portrait = portrait.convert_alpha()
+            # Merchants return across rounds; decode and scale each file once
+            portrait = self._portrait_cache.get(portrait_filename)
+            if portrait is None:
+                # Load and scale the portrait
+                portrait = pygame.image.load(str(portrait_path))
+                # Scale to fit portrait area while maintaining aspect ratio
+                portrait = pygame.transform.scale(
+                    portrait, (PORTRAIT_WIDTH, PORTRAIT_HEIGHT)
+                )
+                # Convert to surface with alpha channel
+                portrait = portrait.convert_alpha()
+                self._portrait_cache[portrait_filename] = portrait
             self.current_portrait = portrait
             self.portrait_slide_offset = -PORTRAIT_WIDTH  # Start off-screen left
             return True
@@ -148,6 +154,9 @@ class PygameWindow:
         title_top_padding = 80
         y_offset = title_top_padding
 
+        # Probe the video driver once rather than per failed line
+        headless = os.environ.get("SDL_VIDEODRIVER") == "dummy"
+
         # Render title text centered at top
         for line in lines:
             line = line.strip()
@@ -168,9 +177,7 @@ class PygameWindow:
             except pygame.error as e:
                 # In headless mode, font rendering may fail
                 # Check if we're in headless mode before skipping
-                import os
-
-                if os.environ.get("SDL_VIDEODRIVER") == "dummy":
+                if headless:
                     y_offset += 50  # Add approximate spacing in headless mode
                 else:
                     # In normal mode, print error and try with fallback font